@@ -9,9 +9,9 @@
  */
 
 import { readFile, readdir, stat } from 'node:fs/promises';
-import { existsSync, statSync } from 'node:fs';
+import { existsSync, readdirSync } from 'node:fs';
 import { join, dirname, basename, extname } from 'node:path';
-import { CardDatabase, createCardDatabase, CardRecord } from './database.js';
+import { CardDatabase, getSharedCardDatabase, CardRecord, NewCardRecord } from './database.js';
 import { logger } from './logger.js';
 
 export interface IntegrityResult {
@@ -33,13 +33,40 @@ export interface DatabaseReport {
   databaseCoverage: number;
 }
 
+/**
+ * Create an existence check that lists each directory once instead of stat-ing every file that is present.
+ * Listings are kept for the lifetime of the returned function, so use a fresh one per pass.
+ */
+function createFileExistenceCheck(): (filePath: string) => boolean {
+  // null marks a directory that could not be listed; those fall back to per-file checks
+  const listings = new Map<string, Set<string> | null>();
+
+  return (filePath: string): boolean => {
+    const directory = dirname(filePath);
+    let names = listings.get(directory);
+    if (names === undefined) {
+      try {
+        names = new Set(readdirSync(directory));
+      } catch (error: any) {
+        names = error.code === 'ENOENT' || error.code === 'ENOTDIR' ? new Set() : null;
+      }
+      listings.set(directory, names);
+    }
+    // The listing is case-sensitive, so confirm a miss with a real check: on case-insensitive
+    // filesystems (macOS, Windows) a path can exist under differently cased entry names
+    return (names !== null && names.has(basename(filePath))) || existsSync(filePath);
+  };
+}
+
 export class BulkOperations {
   private db: CardDatabase | null = null;
 
+  /**
+   * Fetch the shared database connection; called at the start of every operation so a
+   * connection replaced by a data directory change or closeSharedCardDatabase is never reused.
+   */
   async init(): Promise<void> {
-    if (!this.db) {
-      this.db = await createCardDatabase();
-    }
+    this.db = await getSharedCardDatabase();
   }
 
   /**
@@ -48,15 +75,15 @@ export class BulkOperations {
   async verifyDatabaseIntegrity(verbose: boolean = false): Promise<IntegrityResult> {
     await this.init();
 
-    const cards = this.db!.getAllCards();
-    const totalRecords = cards.length;
+    const totalRecords = this.db!.getCardCount();
     let missingFiles = 0;
 
     logger.info(`Verifying ${totalRecords} database records...`);
 
-    for (const card of cards) {
+    const fileExists = createFileExistenceCheck();
+    for (const card of this.db!.iterateCards()) {
       const filename = card.filename;
-      if (!existsSync(filename)) {
+      if (!fileExists(filename)) {
         missingFiles++;
         if (verbose) {
           logger.warn(`Missing file: ${filename} for card ${card.card_name}`);
@@ -93,7 +120,10 @@ export class BulkOperations {
 
     logger.info(`Scanning directory ${directory} for image files...`);
 
-    const imageFiles = await this.walkDirectoryForImages(directory);
+    // The walk also records which JSON sidecars exist, so images without one need no open attempt
+    const sidecarFiles = new Set<string>();
+    const imageFiles = await this.walkDirectoryForImages(directory, sidecarFiles);
+    const candidates: NewCardRecord[] = [];
 
     for (const filePath of imageFiles) {
       totalFiles++;
@@ -112,7 +142,8 @@ export class BulkOperations {
         let setCode: string | undefined;
         let imageUrl: string | undefined;
 
-        if (existsSync(jsonFilePath)) {
+        // Only sidecars seen during the directory walk are read
+        if (sidecarFiles.has(jsonFilePath)) {
           try {
             const jsonContent = await readFile(jsonFilePath, 'utf-8');
             const cardData = JSON.parse(jsonContent);
@@ -123,8 +154,8 @@ export class BulkOperations {
             if (cardData.name) {
               cardName = cardData.name;
             }
-          } catch (error) {
-            if (verbose) {
+          } catch (error: any) {
+            if (verbose && error.code !== 'ENOENT') {
               logger.error(`Error parsing JSON file: ${jsonFilePath}`, error);
             }
           }
@@ -134,21 +165,7 @@ export class BulkOperations {
         const cardVersionId = `${cardName}_${setCode || ''}_${cardId || ''}_art_crop`;
 
         if (updateDb) {
-          if (!this.db!.cardExists(cardVersionId)) {
-            this.db!.addCard(
-              cardVersionId,
-              filePath,
-              cardId,
-              setCode,
-              imageUrl
-            );
-            addedToDb++;
-            if (verbose) {
-              logger.info(`Added to database: ${filePath}`);
-            }
-          } else if (verbose) {
-            logger.debug(`Already in database: ${filePath}`);
-          }
+          candidates.push({ cardName: cardVersionId, filename: filePath, cardId, setCode, imageUrl });
         } else if (verbose) {
           logger.debug(`Found image: ${filePath}`);
         }
@@ -159,6 +176,29 @@ export class BulkOperations {
       }
     }
 
+    if (updateDb && candidates.length > 0) {
+      // One existence query per chunk of names and one transaction for the inserts
+      const known = this.db!.cardsExistBulk(candidates.map(candidate => candidate.cardName));
+      const toAdd: NewCardRecord[] = [];
+
+      for (const candidate of candidates) {
+        if (known.has(candidate.cardName)) {
+          if (verbose) {
+            logger.debug(`Already in database: ${candidate.filename}`);
+          }
+          continue;
+        }
+        known.add(candidate.cardName);
+        toAdd.push(candidate);
+        if (verbose) {
+          logger.info(`Added to database: ${candidate.filename}`);
+        }
+      }
+
+      this.db!.addCardsBulk(toAdd);
+      addedToDb = toAdd.length;
+    }
+
     logger.info(`Found ${totalFiles} image files.`);
     if (updateDb) {
       logger.info(`Added ${addedToDb} new records to the database.`);
@@ -170,7 +210,7 @@ export class BulkOperations {
   /**
    * Recursively walk a directory and find all image files.
    */
-  private async walkDirectoryForImages(directory: string): Promise<string[]> {
+  private async walkDirectoryForImages(directory: string, jsonFiles?: Set<string>): Promise<string[]> {
     const imageFiles: string[] = [];
     const imageExtensions = ['.jpg', '.png', '.jpeg', '.gif'];
 
@@ -184,9 +224,11 @@ export class BulkOperations {
           const extension = extname(entry.name).toLowerCase();
           if (imageExtensions.includes(extension)) {
             imageFiles.push(fullPath);
+          } else if (extension === '.json') {
+            jsonFiles?.add(fullPath);
           }
         } else if (entry.isDirectory()) {
-          const subFiles = await this.walkDirectoryForImages(fullPath);
+          const subFiles = await this.walkDirectoryForImages(fullPath, jsonFiles);
           imageFiles.push(...subFiles);
         }
       }
@@ -203,14 +245,15 @@ export class BulkOperations {
   async cleanDatabase(dryRun: boolean = true, verbose: boolean = false): Promise<number> {
     await this.init();
 
-    const cards = this.db!.getAllCards();
     const toRemove: string[] = [];
 
-    logger.info(`Checking ${cards.length} database records for missing files...`);
+    logger.info(`Checking ${this.db!.getCardCount()} database records for missing files...`);
 
-    for (const card of cards) {
+    // Removals happen after the loop, once the iterator has released the connection
+    const fileExists = createFileExistenceCheck();
+    for (const card of this.db!.iterateCards()) {
       const filename = card.filename;
-      if (!existsSync(filename)) {
+      if (!fileExists(filename)) {
         toRemove.push(card.card_name);
         if (verbose) {
           logger.info(`Will remove: ${card.card_name} (file: ${filename})`);
@@ -221,9 +264,8 @@ export class BulkOperations {
     if (dryRun) {
       logger.info(`Would remove ${toRemove.length} records from the database (dry run).`);
     } else {
-      for (const cardName of toRemove) {
-        this.db!.removeCard(cardName);
-      }
+      // A single transaction commits all removals with one journal sync
+      this.db!.removeCardsBulk(toRemove);
       logger.info(`Removed ${toRemove.length} records from the database.`);
     }
 
@@ -236,23 +278,21 @@ export class BulkOperations {
   async generateReport(): Promise<DatabaseReport> {
     await this.init();
 
-    const cards = this.db!.getAllCards();
-    const totalRecords = cards.length;
-
-    // Count by set
+    // Count by set and check for missing files in a single streamed pass
+    let totalRecords = 0;
+    let missingFiles = 0;
     const sets: Record<string, number> = {};
-    for (const card of cards) {
+    const fileExists = createFileExistenceCheck();
+    for (const card of this.db!.iterateCards()) {
+      totalRecords++;
+
       const setCode = card.set_code || 'Unknown';
       if (!sets[setCode]) {
         sets[setCode] = 0;
       }
       sets[setCode]++;
-    }
 
-    // Check for missing files
-    let missingFiles = 0;
-    for (const card of cards) {
-      if (!existsSync(card.filename)) {
+      if (!fileExists(card.filename)) {
         missingFiles++;
       }
     }
@@ -262,28 +302,28 @@ export class BulkOperations {
     let totalImages = 0;
     const imageDir = '.local/scryfall_images';
 
-    if (existsSync(imageDir)) {
-      try {
-        const entries = await readdir(imageDir, { withFileTypes: true });
-        const setDirs = entries.filter(entry => entry.isDirectory()).map(entry => entry.name);
-        setDirectories = setDirs.length;
-
-        // Count image files
-        for (const setDir of setDirs) {
-          const setPath = join(imageDir, setDir);
-          try {
-            const files = await readdir(setPath);
-            const imageFiles = files.filter(file => {
-              const fullPath = join(setPath, file);
-              return statSync(fullPath).isFile() && 
-                     ['.jpg', '.png', '.jpeg', '.gif'].includes(extname(file).toLowerCase());
-            });
-            totalImages += imageFiles.length;
-          } catch (error) {
-            // Ignore errors for individual directories
-          }
+    try {
+      const entries = await readdir(imageDir, { withFileTypes: true });
+      const setDirs = entries.filter(entry => entry.isDirectory()).map(entry => entry.name);
+      setDirectories = setDirs.length;
+
+      // Count image files
+      for (const setDir of setDirs) {
+        const setPath = join(imageDir, setDir);
+        try {
+          // Dirent types come from the directory listing itself, so no per-file stat is needed
+          const files = await readdir(setPath, { withFileTypes: true });
+          const imageFiles = files.filter(file =>
+            file.isFile() && ['.jpg', '.png', '.jpeg', '.gif'].includes(extname(file.name).toLowerCase())
+          );
+          totalImages += imageFiles.length;
+        } catch (error) {
+          // Ignore errors for individual directories
         }
-      } catch (error) {
+      }
+    } catch (error: any) {
+      // A missing image directory simply means nothing has been downloaded yet
+      if (error.code !== 'ENOENT') {
         logger.error(`Error reading image directory ${imageDir}:`, error);
       }
     }
@@ -328,12 +368,10 @@ export class BulkOperations {
   }
 
   /**
-   * Close the database connection.
+   * Release the shared database connection; it is closed by closeSharedCardDatabase.
    */
   close(): void {
-    if (this.db) {
-      this.db.close();
-    }
+    this.db = null;
   }
 }
 
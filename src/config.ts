@@ -3,11 +3,19 @@
  */
 
 import { tmpdir, homedir, platform } from 'node:os';
-import { join } from 'node:path';
+import { join, dirname } from 'node:path';
 import { mkdir, writeFile, unlink, access } from 'node:fs/promises';
 import { existsSync, constants } from 'node:fs';
 import { logger } from './logger.js';
 
+// Memoized results for the hot configuration lookups. The environment does not change
+// while the server is running, so these only need to be computed once per process.
+let mcpModeCache: boolean | undefined;
+const storageDirectoryCache = new Map<string, string>();
+let storageDirectoryCacheDataDir: string | undefined;
+// Directories (and their ancestors) already created by ensureDirectory in this process
+const createdDirectories = new Set<string>();
+
 /**
  * Detect if running under Claude Desktop context.
  * @returns True if Claude Desktop is detected
@@ -129,9 +137,12 @@ function getWindowsAppDataPath(): string {
  * @returns True if running in MCP mode, false otherwise
  */
 export function isMcpMode(): boolean {
-  // Check for MCP-specific environment variables or execution context
-  return process.env['MCP_SERVER_NAME'] !== undefined || 
-         process.env['MCP_ENABLE_FILE_DOWNLOADS'] !== undefined;
+  if (mcpModeCache === undefined) {
+    // Check for MCP-specific environment variables or execution context
+    mcpModeCache = process.env['MCP_SERVER_NAME'] !== undefined || 
+                   process.env['MCP_ENABLE_FILE_DOWNLOADS'] !== undefined;
+  }
+  return mcpModeCache;
 }
 
 /**
@@ -179,12 +190,54 @@ export async function validateStorageDirectory(directory: string): Promise<void>
   }
 }
 
+/**
+ * Create a directory (recursively) at most once per process.
+ * Ancestors are recorded too, so a later call for a parent directory is also skipped.
+ * @param directory Path of the directory to create
+ */
+export async function ensureDirectory(directory: string): Promise<void> {
+  if (createdDirectories.has(directory)) {
+    return;
+  }
+  await mkdir(directory, { recursive: true });
+  for (let current = directory; !createdDirectories.has(current); current = dirname(current)) {
+    createdDirectories.add(current);
+    if (dirname(current) === current) {
+      break;
+    }
+  }
+}
+
 /**
  * Get the appropriate storage directory based on execution mode.
+ * Results are cached per subdirectory; the cache is reset if SCRYFALL_DATA_DIR changes.
  * @param subdirectory Optional subdirectory name within the storage directory
  * @returns Path string for the storage directory
  */
 export async function getStorageDirectory(subdirectory?: string): Promise<string> {
+  const dataDir = process.env['SCRYFALL_DATA_DIR'];
+  if (dataDir !== storageDirectoryCacheDataDir) {
+    storageDirectoryCache.clear();
+    storageDirectoryCacheDataDir = dataDir;
+  }
+
+  const cacheKey = subdirectory ?? '';
+  const cachedDir = storageDirectoryCache.get(cacheKey);
+  if (cachedDir !== undefined) {
+    return cachedDir;
+  }
+
+  const storageDir = await resolveStorageDirectory(subdirectory);
+  storageDirectoryCache.set(cacheKey, storageDir);
+  return storageDir;
+}
+
+/**
+ * Resolve, create and validate the storage directory, falling back to alternatives on failure.
+ * @param subdirectory Optional subdirectory name within the storage directory
+ * @returns Path string for the storage directory
+ */
+async function resolveStorageDirectory(subdirectory?: string): Promise<string> {
   let baseDir: string;
   
   try {
@@ -238,9 +291,9 @@ export async function getStorageDirectory(subdirectory?: string): Promise<string
     // Add subdirectory if specified
     const storageDir = subdirectory ? join(baseDir, subdirectory) : baseDir;
     
-    // Ensure directory exists with better error handling
+    // Ensure directory exists with better error handling (skipped if already created this run)
     try {
-      await mkdir(storageDir, { recursive: true });
+      await ensureDirectory(storageDir);
       logger.info(`Created/verified storage directory: ${storageDir}`);
     } catch (mkdirError: any) {
       throw new Error(`Failed to create storage directory ${storageDir}: ${mkdirError.message || mkdirError}`);
@@ -268,7 +321,7 @@ export async function getStorageDirectory(subdirectory?: string): Promise<string
     for (const fallback of fallbackDirs) {
       try {
         const fallbackPath = subdirectory ? join(fallback, subdirectory) : fallback;
-        await mkdir(fallbackPath, { recursive: true });
+        await ensureDirectory(fallbackPath);
         await validateStorageDirectory(fallbackPath);
         logger.info(`Using fallback directory: ${fallbackPath}`);
         return fallbackPath;
@@ -322,10 +375,8 @@ export async function getDatabasePath(): Promise<string> {
  */
 export async function ensureDirectoryPermissions(directory: string): Promise<boolean> {
   try {
-    // Try to create a test file
-    const testFile = join(directory, '.permission_test');
-    await writeFile(testFile, '');
-    await unlink(testFile);
+    // A single access() check; callers treat the answer as a pre-flight hint, not a guarantee
+    await access(directory, constants.W_OK);
     return true;
   } catch (error) {
     return false;
@@ -4,11 +4,30 @@
 
 import Database from 'better-sqlite3';
 import { join, dirname } from 'node:path';
-import { mkdir } from 'node:fs/promises';
 import { v4 as uuidv4 } from 'uuid';
-import { getDatabasePath } from './config.js';
+import { getDatabasePath, ensureDirectory } from './config.js';
 import { logger } from './logger.js';
 
+// Bump when initDb gains a new migration step; databases at this version skip the schema checks
+const SCHEMA_VERSION = 4;
+
+// Stays below SQLite's default limit of 999 bound parameters per statement
+const BULK_QUERY_CHUNK_SIZE = 900;
+
+// Upsert keyed on file_id so re-registering a file updates the row in place (same id)
+const INSERT_CARD_SQL = `
+  INSERT INTO downloaded_cards 
+  (card_name, filename, card_id, set_code, image_url, file_id, download_date)
+  VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+  ON CONFLICT(file_id) DO UPDATE SET
+    card_name = excluded.card_name,
+    filename = excluded.filename,
+    card_id = excluded.card_id,
+    set_code = excluded.set_code,
+    image_url = excluded.image_url,
+    download_date = CURRENT_TIMESTAMP
+`;
+
 export interface CardRecord {
   id: number;
   card_name: string;
@@ -20,9 +39,19 @@ export interface CardRecord {
   file_id: string;
 }
 
+export interface NewCardRecord {
+  cardName: string;
+  filename: string;
+  cardId?: string | undefined;
+  setCode?: string | undefined;
+  imageUrl?: string | undefined;
+  fileId?: string | undefined;
+}
+
 export class CardDatabase {
   private db: Database.Database;
   private dbPath: string;
+  private statements = new Map<string, Database.Statement>();
 
   constructor(dbPath?: string) {
     this.dbPath = dbPath || '';
@@ -42,7 +71,7 @@ export class CardDatabase {
       }
 
       // Ensure the directory exists
-      await mkdir(dirname(this.dbPath), { recursive: true });
+      await ensureDirectory(dirname(this.dbPath));
 
       // Create database connection with better error handling
       try {
@@ -51,6 +80,13 @@ export class CardDatabase {
       } catch (dbError: any) {
         throw new Error(`Failed to create database connection at ${this.dbPath}: ${dbError.message || dbError}`);
       }
+
+      // WAL keeps commits append-only and lets readers proceed while a download is writing
+      this.db.pragma('journal_mode = WAL');
+      this.db.pragma('synchronous = NORMAL');
+      this.db.pragma('temp_store = MEMORY');
+      // Negative values are KiB: allow up to 64 MiB of page cache so repeat lookups stay in memory
+      this.db.pragma('cache_size = -65536');
       
       // Initialize the database schema
       await this.initDb();
@@ -69,6 +105,13 @@ export class CardDatabase {
    */
   private async initDb(): Promise<void> {
     try {
+      // Databases already migrated to the current schema don't need the introspection below
+      const userVersion = this.db.pragma('user_version', { simple: true }) as number;
+      if (userVersion >= SCHEMA_VERSION) {
+        logger.debug(`Database schema is at version ${userVersion}, skipping migration checks`);
+        return;
+      }
+
       // Create the main table with proper schema matching Python version
       this.db.exec(`
         CREATE TABLE IF NOT EXISTS downloaded_cards (
@@ -173,6 +216,15 @@ export class CardDatabase {
           updateStmt.run(fileId, card.id);
         }
       }
+
+      // card_name lost its UNIQUE index in the multi-version migration; keep lookups indexed
+      this.db.exec('CREATE INDEX IF NOT EXISTS idx_card_name ON downloaded_cards(card_name)');
+
+      // LIKE is case-insensitive, so prefix lookups for transform faces need a NOCASE index;
+      // the case-folded key is computed once at insert time instead of per row on every query
+      this.db.exec('CREATE INDEX IF NOT EXISTS idx_card_name_nocase ON downloaded_cards(card_name COLLATE NOCASE)');
+
+      this.db.pragma(`user_version = ${SCHEMA_VERSION}`);
       
     } catch (error: any) {
       logger.error(`Database schema initialization failed: ${error.message}`);
@@ -282,6 +334,18 @@ export class CardDatabase {
     }
   }
 
+  /**
+   * Get a prepared statement for the given SQL, compiling it only on first use.
+   */
+  private statement(sql: string): Database.Statement {
+    let stmt = this.statements.get(sql);
+    if (!stmt) {
+      stmt = this.db.prepare(sql);
+      this.statements.set(sql, stmt);
+    }
+    return stmt;
+  }
+
   /**
    * Check if a card has already been downloaded.
    */
@@ -291,14 +355,12 @@ export class CardDatabase {
     if (checkAllFaces) {
       // Check if any face of the card exists (for transform cards)
       const baseName = this.extractBaseName(cardName);
-      const stmt = this.db.prepare("SELECT 1 FROM downloaded_cards WHERE card_name LIKE ? OR card_name = ?");
-      const result = stmt.get(`${baseName}%`, cardName);
-      return result !== undefined;
+      const stmt = this.statement("SELECT EXISTS(SELECT 1 FROM downloaded_cards WHERE card_name LIKE ? OR card_name = ? LIMIT 1)").pluck();
+      return stmt.get(`${baseName}%`, cardName) === 1;
     } else {
-      // Exact match (existing behavior)
-      const stmt = this.db.prepare("SELECT 1 FROM downloaded_cards WHERE card_name = ?");
-      const result = stmt.get(cardName);
-      return result !== undefined;
+      // Exact match (existing behavior), served by idx_card_name
+      const stmt = this.statement("SELECT EXISTS(SELECT 1 FROM downloaded_cards WHERE card_name = ? LIMIT 1)").pluck();
+      return stmt.get(cardName) === 1;
     }
   }
 
@@ -315,22 +377,58 @@ export class CardDatabase {
   ): string {
     const finalFileId = fileId || uuidv4();
 
-    const stmt = this.db.prepare(`
-      INSERT OR REPLACE INTO downloaded_cards 
-      (card_name, filename, card_id, set_code, image_url, file_id, download_date)
-      VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-    `);
-
+    const stmt = this.statement(INSERT_CARD_SQL);
     stmt.run(cardName, filename, cardId || null, setCode || null, imageUrl || null, finalFileId);
     
     return finalFileId;
   }
 
+  /**
+   * Add several cards in a single transaction and return their file IDs in input order.
+   */
+  addCardsBulk(cards: NewCardRecord[]): string[] {
+    const stmt = this.statement(INSERT_CARD_SQL);
+    const insertAll = this.db.transaction((rows: NewCardRecord[]) =>
+      rows.map(row => {
+        const finalFileId = row.fileId || uuidv4();
+        stmt.run(
+          row.cardName,
+          row.filename,
+          row.cardId || null,
+          row.setCode || null,
+          row.imageUrl || null,
+          finalFileId
+        );
+        return finalFileId;
+      })
+    );
+    return insertAll(cards);
+  }
+
+  /**
+   * Return the subset of the given card names that already have a database record.
+   */
+  cardsExistBulk(cardNames: string[]): Set<string> {
+    const existing = new Set<string>();
+    for (let start = 0; start < cardNames.length; start += BULK_QUERY_CHUNK_SIZE) {
+      const chunk = cardNames.slice(start, start + BULK_QUERY_CHUNK_SIZE);
+      const placeholders = chunk.map(() => '?').join(', ');
+      const rows = this.db
+        .prepare(`SELECT DISTINCT card_name FROM downloaded_cards WHERE card_name IN (${placeholders})`)
+        .pluck()
+        .all(...chunk) as string[];
+      for (const name of rows) {
+        existing.add(name);
+      }
+    }
+    return existing;
+  }
+
   /**
    * Get information about a downloaded card.
    */
   getCardInfo(cardName: string): CardRecord | undefined {
-    const stmt = this.db.prepare("SELECT * FROM downloaded_cards WHERE card_name = ?");
+    const stmt = this.statement("SELECT * FROM downloaded_cards WHERE card_name = ?");
     return stmt.get(cardName) as CardRecord | undefined;
   }
 
@@ -348,7 +446,7 @@ export class CardDatabase {
    * Get all faces of a card by its base name.
    */
   getCardsByBaseName(baseName: string): CardRecord[] {
-    const stmt = this.db.prepare("SELECT * FROM downloaded_cards WHERE card_name LIKE ? OR card_name = ? ORDER BY card_name");
+    const stmt = this.statement("SELECT * FROM downloaded_cards WHERE card_name LIKE ? OR card_name = ? ORDER BY card_name");
     return stmt.all(`${baseName} (Face %`, baseName) as CardRecord[];
   }
 
@@ -372,7 +470,7 @@ export class CardDatabase {
     
     query += " ORDER BY card_name";
     
-    const stmt = this.db.prepare(query);
+    const stmt = this.statement(query);
     return stmt.all(...params) as CardRecord[];
   }
 
@@ -400,12 +498,7 @@ export class CardDatabase {
     const finalFileId = fileId || uuidv4();
     const faceCardName = `${baseName} (Face ${faceIndex}: ${faceName})`;
 
-    const stmt = this.db.prepare(`
-      INSERT OR REPLACE INTO downloaded_cards 
-      (card_name, filename, card_id, set_code, image_url, file_id, download_date)
-      VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-    `);
-
+    const stmt = this.statement(INSERT_CARD_SQL);
     stmt.run(faceCardName, filename, cardId || null, setCode || null, imageUrl || null, finalFileId);
     
     return finalFileId;
@@ -416,7 +509,7 @@ export class CardDatabase {
    */
   getCardFaceInfo(cardName: string, faceIndex: number): CardRecord | undefined {
     const baseName = this.extractBaseName(cardName);
-    const stmt = this.db.prepare("SELECT * FROM downloaded_cards WHERE card_name LIKE ?");
+    const stmt = this.statement("SELECT * FROM downloaded_cards WHERE card_name LIKE ?");
     const pattern = `${baseName} (Face ${faceIndex}:%`;
     return stmt.get(pattern) as CardRecord | undefined;
   }
@@ -425,24 +518,75 @@ export class CardDatabase {
    * Get a list of all downloaded cards.
    */
   getAllCards(): CardRecord[] {
-    const stmt = this.db.prepare("SELECT * FROM downloaded_cards ORDER BY download_date DESC");
+    const stmt = this.statement("SELECT * FROM downloaded_cards ORDER BY download_date DESC");
     return stmt.all() as CardRecord[];
   }
 
+  /**
+   * Iterate over all downloaded cards one row at a time without materializing the full list.
+   * The connection is busy until iteration finishes, so don't write to the database inside the loop.
+   */
+  iterateCards(): IterableIterator<CardRecord> {
+    const stmt = this.statement("SELECT * FROM downloaded_cards");
+    return stmt.iterate() as IterableIterator<CardRecord>;
+  }
+
+  /**
+   * Count the downloaded card records.
+   */
+  getCardCount(): number {
+    const stmt = this.statement("SELECT COUNT(*) FROM downloaded_cards").pluck();
+    return stmt.get() as number;
+  }
+
+  /**
+   * Count records per set code, largest sets first. Records without a set are counted as 'Unknown'.
+   */
+  getSetCounts(): Record<string, number> {
+    const stmt = this.statement(`
+      SELECT CASE WHEN set_code IS NULL OR set_code = '' THEN 'Unknown' ELSE set_code END AS set_code,
+             COUNT(*) AS count
+      FROM downloaded_cards
+      GROUP BY 1
+      ORDER BY count DESC
+    `);
+    const rows = stmt.all() as { set_code: string; count: number }[];
+    return Object.fromEntries(rows.map(row => [row.set_code, row.count]));
+  }
+
+  /**
+   * Get the most recently downloaded cards.
+   */
+  getRecentCards(limit: number): Pick<CardRecord, 'card_name' | 'download_date'>[] {
+    const stmt = this.statement("SELECT card_name, download_date FROM downloaded_cards ORDER BY download_date DESC LIMIT ?");
+    return stmt.all(limit) as Pick<CardRecord, 'card_name' | 'download_date'>[];
+  }
+
   /**
    * Remove a card from the database.
    */
   removeCard(cardName: string): boolean {
-    const stmt = this.db.prepare("DELETE FROM downloaded_cards WHERE card_name = ?");
+    const stmt = this.statement("DELETE FROM downloaded_cards WHERE card_name = ?");
     const result = stmt.run(cardName);
     return result.changes > 0;
   }
 
+  /**
+   * Remove several cards in one transaction, returning the number of deleted rows.
+   */
+  removeCardsBulk(cardNames: string[]): number {
+    const stmt = this.statement("DELETE FROM downloaded_cards WHERE card_name = ?");
+    const removeAll = this.db.transaction((names: string[]) =>
+      names.reduce((changes, name) => changes + stmt.run(name).changes, 0)
+    );
+    return removeAll(cardNames);
+  }
+
   /**
    * Get card information by file ID.
    */
   getCardByFileId(fileId: string): CardRecord | undefined {
-    const stmt = this.db.prepare("SELECT * FROM downloaded_cards WHERE file_id = ?");
+    const stmt = this.statement("SELECT * FROM downloaded_cards WHERE file_id = ?");
     return stmt.get(fileId) as CardRecord | undefined;
   }
 
@@ -450,7 +594,7 @@ export class CardDatabase {
    * Get the file path for a given file ID.
    */
   getFilePathById(fileId: string): string | undefined {
-    const stmt = this.db.prepare("SELECT filename FROM downloaded_cards WHERE file_id = ?");
+    const stmt = this.statement("SELECT filename FROM downloaded_cards WHERE file_id = ?");
     const result = stmt.get(fileId) as { filename: string } | undefined;
     return result?.filename;
   }
@@ -459,6 +603,7 @@ export class CardDatabase {
    * Close the database connection.
    */
   close(): void {
+    this.statements.clear();
     if (this.db) {
       this.db.close();
     }
@@ -479,4 +624,49 @@ export async function createCardDatabase(dbPath?: string): Promise<CardDatabase>
   const db = new CardDatabase(dbPath);
   await db.init();
   return db;
+}
+
+let sharedDatabase: Promise<CardDatabase> | null = null;
+let sharedDatabasePath: string | undefined;
+
+/**
+ * Get the process-wide database connection, opening it on first use.
+ * better-sqlite3 is synchronous, so one connection serves every request without
+ * re-running migrations and integrity checks each time. Callers must not close it,
+ * and should call this again per operation instead of keeping the instance, since the
+ * connection is replaced when SCRYFALL_DATA_DIR changes or closeSharedCardDatabase runs.
+ */
+export async function getSharedCardDatabase(): Promise<CardDatabase> {
+  const dbPath = await getDatabasePath();
+  if (!sharedDatabase || sharedDatabasePath !== dbPath) {
+    // A connection to a previous data directory is no longer handed out, so release its handle and WAL
+    const previous = sharedDatabase;
+    sharedDatabasePath = dbPath;
+    sharedDatabase = createCardDatabase(dbPath).catch((error) => {
+      sharedDatabase = null;
+      throw error;
+    });
+    if (previous) {
+      previous.then(db => db.close(), () => {
+        // The previous connection never opened, so there is nothing to close
+      });
+    }
+  }
+  return sharedDatabase;
+}
+
+/**
+ * Close the process-wide database connection, if it was opened.
+ */
+export async function closeSharedCardDatabase(): Promise<void> {
+  const pending = sharedDatabase;
+  sharedDatabase = null;
+  sharedDatabasePath = undefined;
+  if (pending) {
+    try {
+      (await pending).close();
+    } catch (error) {
+      // The connection never opened, so there is nothing to close
+    }
+  }
 }
\ No newline at end of file
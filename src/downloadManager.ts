@@ -2,17 +2,21 @@
  * Download manager for Scryfall card images and art crops.
  */
 
-import { writeFile, mkdir } from 'node:fs/promises';
-import { join, dirname, extname } from 'node:path';
+import { writeFile, rename, rm } from 'node:fs/promises';
+import { createWriteStream } from 'node:fs';
+import { pipeline } from 'node:stream/promises';
+import { join, dirname, extname, sep } from 'node:path';
 import fetch from 'node-fetch';
-import { scryfallClient, Card } from './scryfallClient.js';
-import { CardDatabase, createCardDatabase } from './database.js';
-import { getCardImagesDirectory, getArtCropsDirectory } from './config.js';
+import { v4 as uuidv4 } from 'uuid';
+import { scryfallClient, scryfallAgent, SCRYFALL_USER_AGENT, Card } from './scryfallClient.js';
+import { CardDatabase, getSharedCardDatabase, NewCardRecord } from './database.js';
+import { getCardImagesDirectory, getArtCropsDirectory, ensureDirectory } from './config.js';
 import { logger } from './logger.js';
 
 export interface DownloadResult {
   cardName: string;
   filePath: string;
+  fileId?: string;
   jsonPath?: string;
   face_index?: number;
   face_name?: string;
@@ -35,12 +39,84 @@ interface ImageUrlInfo {
   faceIndex: number;
 }
 
+// Whitespace and the '//' split-card separator become underscores in one pass over the name
+const FILENAME_UNSAFE_PATTERN = /\s|\/\//g;
+
+// Whitespace and colons in set names become underscores in one pass
+const SET_FOLDER_UNSAFE_PATTERN = /[\s:]/g;
+
+// Write-stream buffer for downloads. Chunks that arrive while a write is in flight are queued
+// and flushed together with writev, so a larger buffer means fewer, larger disk writes.
+const DOWNLOAD_WRITE_BUFFER_SIZE = 2 * 1024 * 1024;
+
+// Number of cards fetched and downloaded at the same time
+export const DOWNLOAD_CONCURRENCY = 4;
+
+/**
+ * Map over items with at most `limit` callbacks in flight, preserving result order.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let nextIndex = 0;
+  const worker = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index]!, index);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+/**
+ * Get the file extension of an image URL, ignoring any query string, in a single pass.
+ */
+function imageExtensionFromUrl(url: string): string {
+  const queryStart = url.indexOf('?');
+  return extname(queryStart === -1 ? url : url.slice(0, queryStart));
+}
+
 export class DownloadManager {
   private db: CardDatabase | null = null;
 
+  /**
+   * Fetch the shared database connection; called at the start of every operation so a
+   * connection replaced by a data directory change or closeSharedCardDatabase is never reused.
+   */
   async init(): Promise<void> {
-    if (!this.db) {
-      this.db = await createCardDatabase();
+    this.db = await getSharedCardDatabase();
+  }
+
+  /**
+   * Stream a remote image straight to disk instead of buffering the whole body in memory.
+   * The body is written to a `.part` file and renamed into place, so an interrupted
+   * download never leaves a truncated image at the final path.
+   */
+  private async downloadToFile(url: string, filePath: string): Promise<void> {
+    // Image requests draw from the same rate limit as API calls
+    await scryfallClient.throttle();
+    // Images are already compressed, so skip content-encoding negotiation and decoding
+    const response = await fetch(url, {
+      agent: scryfallAgent,
+      compress: false,
+      headers: { 'User-Agent': SCRYFALL_USER_AGENT, 'Accept': 'image/*' }
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+    }
+
+    // A unique part name per call, so two downloads of the same file never share a temp file
+    const partialPath = `${filePath}.${uuidv4()}.part`;
+    try {
+      await pipeline(response.body, createWriteStream(partialPath, { highWaterMark: DOWNLOAD_WRITE_BUFFER_SIZE }));
+      await rename(partialPath, filePath);
+    } catch (error) {
+      await rm(partialPath, { force: true });
+      throw error;
     }
   }
 
@@ -82,10 +158,24 @@ export class DownloadManager {
   async downloadCardImages(
     cardNames: string[],
     forceDownload: boolean = false,
-    setCodes?: string[],
-    collectorNumbers?: string[],
+    setCodes?: Array<string | undefined>,
+    collectorNumbers?: Array<string | undefined>,
     baseDir?: string
   ): Promise<DownloadResult[]> {
+    return (await this.downloadCardImagesPerCard(cardNames, forceDownload, setCodes, collectorNumbers, baseDir)).flat();
+  }
+
+  /**
+   * Download card images for a list of card names, returning each card's files at its input position.
+   * Cards that were skipped or failed get an empty list.
+   */
+  async downloadCardImagesPerCard(
+    cardNames: string[],
+    forceDownload: boolean = false,
+    setCodes?: Array<string | undefined>,
+    collectorNumbers?: Array<string | undefined>,
+    baseDir?: string
+  ): Promise<DownloadResult[][]> {
     await this.init();
 
     const setCodesArray = setCodes || new Array(cardNames.length).fill(null);
@@ -107,26 +197,39 @@ export class DownloadManager {
       join(baseDir, 'scryfall_card_images') : 
       await getCardImagesDirectory();
     
-    await mkdir(outputFolder, { recursive: true });
+    await ensureDirectory(outputFolder);
+    // Face filenames are appended to this prefix rather than re-joined per face
+    const outputPrefix = outputFolder + sep;
 
-    for (let index = 0; index < cardNames.length; index++) {
-      const cardName = cardNames[index];
+    // Create a unique identifier for each card version and check them all in one query
+    const cardVersionIds = cardNames.map((cardName, index) => {
       const setCode = setCodesArray[index];
       const collectorNumber = collectorNumbersArray[index];
+      return setCode && collectorNumber ? `${cardName}_${setCode}_${collectorNumber}` : cardName;
+    });
+    const existingVersionIds = forceDownload ? new Set<string>() : this.db!.cardsExistBulk(cardVersionIds);
+    // Faces claimed by this batch, so a face reached twice is downloaded only once
+    const claimedFaceIds = new Set<string>();
+
+    // Cards are handled by a small worker pool (API pacing lives in scryfallClient); each card
+    // collects its own files so the result order still follows the input order
+    const filesPerCard = await mapWithConcurrency(cardNames, DOWNLOAD_CONCURRENCY, async (cardName, index) => {
+      const cardFiles: DownloadResult[] = [];
+      const setCode = setCodesArray[index];
+      const collectorNumber = collectorNumbersArray[index];
+      const cardVersionId = cardVersionIds[index];
 
-      const cardNameForFilename = (cardName ?? 'unknown').replace(/\s/g, '_').replace(/\/\//g, '_');
-
-      // Create a unique identifier for the card version
-      let cardVersionId = cardName;
-      if (setCode && collectorNumber) {
-        cardVersionId = `${cardName}_${setCode}_${collectorNumber}`;
-      }
+      const cardNameForFilename = (cardName ?? 'unknown').replace(FILENAME_UNSAFE_PATTERN, '_');
 
-      // Check if the card exists in the database
-      if (cardVersionId && this.db!.cardExists(cardVersionId) && !forceDownload) {
+      // Skip cards already in the database or already claimed earlier in this batch; the
+      // version ID is claimed before the first await so concurrent workers never both take it
+      if (cardVersionId && existingVersionIds.has(cardVersionId)) {
         logger.info(`[${index + 1}/${cardNames.length}] Image for '${cardName}' (${setCode} #${collectorNumber}) already exists, skipping...`);
         summary.skipped++;
-        continue;
+        return cardFiles;
+      }
+      if (cardVersionId) {
+        existingVersionIds.add(cardVersionId);
       }
 
       try {
@@ -148,72 +251,76 @@ export class DownloadManager {
           const isTransformCard = imageUrls.length > 1;
           logger.info(`[${index + 1}/${cardNames.length}] Found ${imageUrls.length} image(s) for '${cardName}'${isTransformCard ? ' (transform card)' : ''}`);
 
-          let cardDownloaded = false;
-          for (const imageInfo of imageUrls) {
-            try {
-              let imageExtension = extname(imageInfo.url ?? '');
-              if (imageInfo.url.includes('?')) {
-                const urlBase = imageInfo.url.split('?')[0];
-                imageExtension = extname(urlBase ?? '');
+          // Work out every face's filename and version ID first so existence is one query
+          const faces = imageUrls.map(imageInfo => {
+            const imageExtension = imageExtensionFromUrl(imageInfo.url);
+
+            // Generate filename based on whether it's a transform card
+            let imageFilename: string;
+            let faceCardVersionId: string;
+            
+            if (isTransformCard) {
+              const faceNameForFilename = imageInfo.faceName.replace(FILENAME_UNSAFE_PATTERN, '_');
+              if (setCode && collectorNumber) {
+                imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
+                faceCardVersionId = `${cardName}_${setCode}_${collectorNumber}_face${imageInfo.faceIndex}`;
+              } else {
+                imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}${imageExtension}`;
+                faceCardVersionId = `${cardName}_face${imageInfo.faceIndex}`;
               }
-
-              // Generate filename based on whether it's a transform card
-              let imageFilename: string;
-              let faceCardVersionId: string;
-              
-              if (isTransformCard) {
-                const faceNameForFilename = imageInfo.faceName.replace(/\s/g, '_').replace(/\/\//g, '_');
-                if (setCode && collectorNumber) {
-                  imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
-                  faceCardVersionId = `${cardName}_${setCode}_${collectorNumber}_face${imageInfo.faceIndex}`;
-                } else {
-                  imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}${imageExtension}`;
-                  faceCardVersionId = `${cardName}_face${imageInfo.faceIndex}`;
-                }
+            } else {
+              // Single-faced card - maintain existing pattern for backward compatibility
+              if (setCode && collectorNumber) {
+                imageFilename = `${cardNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
+                faceCardVersionId = cardVersionId ?? cardName ?? 'unknown';
               } else {
-                // Single-faced card - maintain existing pattern for backward compatibility
-                if (setCode && collectorNumber) {
-                  imageFilename = `${cardNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
-                  faceCardVersionId = cardVersionId ?? cardName ?? 'unknown';
-                } else {
-                  imageFilename = `${cardNameForFilename}${imageExtension}`;
-                  faceCardVersionId = cardVersionId ?? cardName ?? 'unknown';
-                }
+                imageFilename = `${cardNameForFilename}${imageExtension}`;
+                faceCardVersionId = cardVersionId ?? cardName ?? 'unknown';
               }
+            }
+
+            return { imageInfo, imageFilename, faceCardVersionId };
+          });
+          const existingFaceIds = forceDownload
+            ? new Set<string>()
+            : this.db!.cardsExistBulk(faces.map(face => face.faceCardVersionId));
 
+          const newRecords: NewCardRecord[] = [];
+          let cardDownloaded = false;
+          for (const { imageInfo, imageFilename, faceCardVersionId } of faces) {
+            try {
               // Check if this specific face already exists
-              if (this.db!.cardExists(faceCardVersionId) && !forceDownload) {
+              if (existingFaceIds.has(faceCardVersionId) || claimedFaceIds.has(faceCardVersionId)) {
                 logger.info(`Face ${imageInfo.faceIndex} (${imageInfo.faceName}) already exists, skipping...`);
                 continue;
               }
+              claimedFaceIds.add(faceCardVersionId);
 
-              const imageFilepath = join(outputFolder, imageFilename);
+              const imageFilepath = outputPrefix + imageFilename;
 
               logger.info(`[${index + 1}/${cardNames.length}] Downloading face ${imageInfo.faceIndex} (${imageInfo.faceName})...`);
               
-              const imageResponse = await fetch(imageInfo.url);
-              if (!imageResponse.ok) {
-                throw new Error(`HTTP ${imageResponse.status}: ${imageResponse.statusText}`);
-              }
-
-              const imageBuffer = await imageResponse.buffer();
-              await writeFile(imageFilepath, imageBuffer);
+              await this.downloadToFile(imageInfo.url, imageFilepath);
               logger.info(`Saved to ${imageFilepath}`);
 
-              // Store face-specific database record
+              // Queue the face-specific database record; the card's faces are inserted together
               const faceCardName = isTransformCard ? `${cardName} (Face ${imageInfo.faceIndex}: ${imageInfo.faceName})` : cardName;
-              this.db!.addCard(
-                faceCardVersionId,
-                imageFilepath,
-                card.id,
-                card.set,
-                imageInfo.url
-              );
+              // The file ID is assigned here so it can be returned with the result
+              const fileId = uuidv4();
+              newRecords.push({
+                cardName: faceCardVersionId,
+                filename: imageFilepath,
+                cardId: card.id,
+                setCode: card.set,
+                imageUrl: imageInfo.url,
+                fileId
+              });
 
               summary.totalImages!++;
-              summary.downloadedFiles.push({
+              cardFiles.push({
                 cardName: faceCardName ?? 'unknown',
                 filePath: imageFilepath,
+                fileId,
                 face_index: imageInfo.faceIndex,
                 face_name: imageInfo.faceName,
                 total_faces: imageUrls.length,
@@ -226,6 +333,11 @@ export class DownloadManager {
             }
           }
 
+          // One transaction for all faces instead of a commit per face
+          if (newRecords.length > 0) {
+            this.db!.addCardsBulk(newRecords);
+          }
+
           if (cardDownloaded) {
             summary.downloaded++;
           } else {
@@ -240,12 +352,12 @@ export class DownloadManager {
         summary.errors++;
       }
 
-      // Delay between requests (handled by scryfallClient)
-      await new Promise(resolve => setTimeout(resolve, 200));
-    }
+      return cardFiles;
+    });
+    summary.downloadedFiles = filesPerCard.flat();
 
     this.logSummary('Image download', summary);
-    return summary.downloadedFiles;
+    return filesPerCard;
   }
 
   /**
@@ -279,24 +391,37 @@ export class DownloadManager {
       join(baseDir, 'scryfall_images') : 
       await getArtCropsDirectory();
     
-    await mkdir(outputFolder, { recursive: true });
+    await ensureDirectory(outputFolder);
 
-    for (let index = 0; index < cardNames.length; index++) {
-      const cardName = cardNames[index];
+    // Create a unique identifier for each card version and check them all in one query
+    const cardVersionIds = cardNames.map((cardName, index) => {
       const setCode = setCodesArray[index];
       const collectorNumber = collectorNumbersArray[index];
+      return setCode && collectorNumber
+        ? `${cardName}_${setCode}_${collectorNumber}_art_crop`
+        : `${cardName}_art_crop`;
+    });
+    const existingVersionIds = forceDownload ? new Set<string>() : this.db!.cardsExistBulk(cardVersionIds);
+    // Faces claimed by this batch, so a face reached twice is downloaded only once
+    const claimedFaceIds = new Set<string>();
+
+    // Cards are handled by a small worker pool (API pacing lives in scryfallClient); each card
+    // collects its own files so the result order still follows the input order
+    const filesPerCard = await mapWithConcurrency(cardNames, DOWNLOAD_CONCURRENCY, async (cardName, index) => {
+      const cardFiles: DownloadResult[] = [];
+      const setCode = setCodesArray[index];
+      const collectorNumber = collectorNumbersArray[index];
+      const cardVersionId = cardVersionIds[index];
 
-      // Create a unique identifier for the card version
-      let cardVersionId = `${cardName}_art_crop`;
-      if (setCode && collectorNumber) {
-        cardVersionId = `${cardName}_${setCode}_${collectorNumber}_art_crop`;
-      }
-
-      // Check if the card exists in the database
-      if (cardVersionId && this.db!.cardExists(cardVersionId) && !forceDownload) {
+      // Skip cards already in the database or already claimed earlier in this batch; the
+      // version ID is claimed before the first await so concurrent workers never both take it
+      if (cardVersionId && existingVersionIds.has(cardVersionId)) {
         logger.info(`[${index + 1}/${cardNames.length}] Art crop for '${cardName}' (${setCode} #${collectorNumber}) already exists, skipping...`);
         summary.skipped++;
-        continue;
+        return cardFiles;
+      }
+      if (cardVersionId) {
+        existingVersionIds.add(cardVersionId);
       }
 
       try {
@@ -319,89 +444,97 @@ export class DownloadManager {
           logger.info(`[${index + 1}/${cardNames.length}] Found ${imageUrls.length} art crop(s) for '${cardName}'${isTransformCard ? ' (transform card)' : ''}`);
 
           // Create a folder for the set
-          const setName = (card.set_name || 'unknown_set')
-            .replace(/\s/g, '_')
-            .replace(/:/g, '_');
+          const setName = (card.set_name || 'unknown_set').replace(SET_FOLDER_UNSAFE_PATTERN, '_');
           const setFolder = join(outputFolder, setName);
-          await mkdir(setFolder, { recursive: true });
-
-          const cardNameForFilename = (cardName ?? 'unknown').replace(/\s/g, '_').replace(/\/\//g, '_');
-
-          let cardDownloaded = false;
-          for (const imageInfo of imageUrls) {
-            try {
-              let imageExtension = extname(imageInfo.url ?? '');
-              if (imageInfo.url.includes('?')) {
-                const urlBase = imageInfo.url.split('?')[0];
-                imageExtension = extname(urlBase ?? '');
+          await ensureDirectory(setFolder);
+          // Face filenames are appended to this prefix rather than re-joined per face
+          const setFolderPrefix = setFolder + sep;
+
+          const cardNameForFilename = (cardName ?? 'unknown').replace(FILENAME_UNSAFE_PATTERN, '_');
+
+          // Every face's sidecar holds the same card data, so serialize it at most once per card
+          let cardJson: string | undefined;
+
+          // Work out every face's filenames and version ID first so existence is one query
+          const faces = imageUrls.map(imageInfo => {
+            const imageExtension = imageExtensionFromUrl(imageInfo.url);
+
+            // Generate filename based on whether it's a transform card
+            let imageFilename: string;
+            let jsonFilename: string;
+            let faceCardVersionId: string;
+            
+            if (isTransformCard) {
+              const faceNameForFilename = imageInfo.faceName.replace(FILENAME_UNSAFE_PATTERN, '_');
+              if (setCode && collectorNumber) {
+                imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
+                jsonFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}_${setCode}_${collectorNumber}.json`;
+                faceCardVersionId = `${cardName}_${setCode}_${collectorNumber}_face${imageInfo.faceIndex}_art_crop`;
+              } else {
+                imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}${imageExtension}`;
+                jsonFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}.json`;
+                faceCardVersionId = `${cardName}_face${imageInfo.faceIndex}_art_crop`;
               }
-
-              // Generate filename based on whether it's a transform card
-              let imageFilename: string;
-              let jsonFilename: string;
-              let faceCardVersionId: string;
-              
-              if (isTransformCard) {
-                const faceNameForFilename = imageInfo.faceName.replace(/\s/g, '_').replace(/\/\//g, '_');
-                if (setCode && collectorNumber) {
-                  imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
-                  jsonFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}_${setCode}_${collectorNumber}.json`;
-                  faceCardVersionId = `${cardName}_${setCode}_${collectorNumber}_face${imageInfo.faceIndex}_art_crop`;
-                } else {
-                  imageFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}${imageExtension}`;
-                  jsonFilename = `${cardNameForFilename}_face${imageInfo.faceIndex}_${faceNameForFilename}.json`;
-                  faceCardVersionId = `${cardName}_face${imageInfo.faceIndex}_art_crop`;
-                }
+            } else {
+              // Single-faced card - maintain existing pattern for backward compatibility
+              if (setCode && collectorNumber) {
+                imageFilename = `${cardNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
+                jsonFilename = `${cardNameForFilename}_${setCode}_${collectorNumber}.json`;
+                faceCardVersionId = cardVersionId ?? `${cardName}_art_crop`;
               } else {
-                // Single-faced card - maintain existing pattern for backward compatibility
-                if (setCode && collectorNumber) {
-                  imageFilename = `${cardNameForFilename}_${setCode}_${collectorNumber}${imageExtension}`;
-                  jsonFilename = `${cardNameForFilename}_${setCode}_${collectorNumber}.json`;
-                  faceCardVersionId = cardVersionId ?? `${cardName}_art_crop`;
-                } else {
-                  imageFilename = `${cardNameForFilename}${imageExtension}`;
-                  jsonFilename = `${cardNameForFilename}.json`;
-                  faceCardVersionId = cardVersionId ?? `${cardName}_art_crop`;
-                }
+                imageFilename = `${cardNameForFilename}${imageExtension}`;
+                jsonFilename = `${cardNameForFilename}.json`;
+                faceCardVersionId = cardVersionId ?? `${cardName}_art_crop`;
               }
+            }
+
+            return { imageInfo, imageFilename, jsonFilename, faceCardVersionId };
+          });
+          const existingFaceIds = forceDownload
+            ? new Set<string>()
+            : this.db!.cardsExistBulk(faces.map(face => face.faceCardVersionId));
 
+          const newRecords: NewCardRecord[] = [];
+          let cardDownloaded = false;
+          for (const { imageInfo, imageFilename, jsonFilename, faceCardVersionId } of faces) {
+            try {
               // Check if this specific face already exists
-              if (this.db!.cardExists(faceCardVersionId) && !forceDownload) {
+              if (existingFaceIds.has(faceCardVersionId) || claimedFaceIds.has(faceCardVersionId)) {
                 logger.info(`Art crop face ${imageInfo.faceIndex} (${imageInfo.faceName}) already exists, skipping...`);
                 continue;
               }
+              claimedFaceIds.add(faceCardVersionId);
 
-              const imageFilepath = join(setFolder, imageFilename);
-              const jsonFilepath = join(setFolder, jsonFilename);
+              const imageFilepath = setFolderPrefix + imageFilename;
+              const jsonFilepath = setFolderPrefix + jsonFilename;
 
               logger.info(`[${index + 1}/${cardNames.length}] Downloading art crop face ${imageInfo.faceIndex} (${imageInfo.faceName})...`);
               
-              const imageResponse = await fetch(imageInfo.url);
-              if (!imageResponse.ok) {
-                throw new Error(`HTTP ${imageResponse.status}: ${imageResponse.statusText}`);
-              }
-
-              const imageBuffer = await imageResponse.buffer();
-              await writeFile(imageFilepath, imageBuffer);
+              await this.downloadToFile(imageInfo.url, imageFilepath);
               logger.info(`Saved to ${imageFilepath}`);
 
-              // Store face-specific database record
+              // Queue the face-specific database record; the card's faces are inserted together
               const faceCardName = isTransformCard ? `${cardName} (Face ${imageInfo.faceIndex}: ${imageInfo.faceName})` : cardName;
-              this.db!.addCard(
-                faceCardVersionId,
-                imageFilepath,
-                card.id,
-                card.set,
-                imageInfo.url
-              );
+              // The file ID is assigned here so it can be returned with the result
+              const fileId = uuidv4();
+              newRecords.push({
+                cardName: faceCardVersionId,
+                filename: imageFilepath,
+                cardId: card.id,
+                setCode: card.set,
+                imageUrl: imageInfo.url,
+                fileId
+              });
 
               // Save card data to JSON file with face-specific information
-              await writeFile(jsonFilepath, JSON.stringify(card, null, 4), 'utf-8');
+              cardJson ??= JSON.stringify(card, null, 4);
+              await writeFile(jsonFilepath, cardJson, 'utf-8');
 
               summary.totalImages!++;
-              summary.downloadedFiles.push({
+              cardFiles.push({
                 cardName: faceCardName ?? 'unknown',
                 filePath: imageFilepath,
+                fileId,
                 jsonPath: jsonFilepath,
                 face_index: imageInfo.faceIndex,
                 face_name: imageInfo.faceName,
@@ -415,6 +548,11 @@ export class DownloadManager {
             }
           }
 
+          // One transaction for all faces instead of a commit per face
+          if (newRecords.length > 0) {
+            this.db!.addCardsBulk(newRecords);
+          }
+
           if (cardDownloaded) {
             summary.downloaded++;
           } else {
@@ -429,9 +567,9 @@ export class DownloadManager {
         summary.errors++;
       }
 
-      // Delay between requests (handled by scryfallClient)
-      await new Promise(resolve => setTimeout(resolve, 200));
-    }
+      return cardFiles;
+    });
+    summary.downloadedFiles = filesPerCard.flat();
 
     this.logSummary('Art crop download', summary);
     return summary.downloadedFiles;
@@ -452,12 +590,10 @@ export class DownloadManager {
   }
 
   /**
-   * Close the database connection.
+   * Release the shared database connection; it is closed by closeSharedCardDatabase.
    */
   close(): void {
-    if (this.db) {
-      this.db.close();
-    }
+    this.db = null;
   }
 }
 
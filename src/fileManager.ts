@@ -3,13 +3,58 @@
  */
 
 import { readFile, stat, unlink, readdir } from 'node:fs/promises';
-import { existsSync, statSync } from 'node:fs';
-import { join, extname, basename } from 'node:path';
-import { lookup } from 'mime-types';
-import { v4 as uuidv4, validate as isValidUuid } from 'uuid';
-import { CardDatabase, createCardDatabase } from './database.js';
+import { statSync } from 'node:fs';
+import { createRequire } from 'node:module';
+import { join, extname, basename, resolve } from 'node:path';
+import { tmpdir, homedir } from 'node:os';
+import { v4 as uuidv4 } from 'uuid';
+import { CardDatabase, getSharedCardDatabase } from './database.js';
 import { logger } from './logger.js';
 
+// MIME types for the extensions this server writes, checked before the mime-types lookup
+const EXTENSION_MIME_TYPES: Record<string, string> = {
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.png': 'image/png',
+  '.gif': 'image/gif',
+  '.webp': 'image/webp',
+  '.json': 'application/json',
+  '.txt': 'text/plain'
+};
+
+const mimeTypeCache = new Map<string, string>();
+
+// mime-types loads its full database on import; it is only needed for unusual extensions,
+// so it is required on first use instead of at startup
+const requireModule = createRequire(import.meta.url);
+let mimeLookup: typeof import('mime-types')['lookup'] | undefined;
+
+function lookupMimeType(extension: string): string | false {
+  mimeLookup ??= (requireModule('mime-types') as typeof import('mime-types')).lookup;
+  return mimeLookup(extension);
+}
+
+// File IDs are generated with uuidv4; a precompiled pattern rejects malformed IDs cheaply
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
+// Resolved once per SCRYFALL_DATA_DIR value instead of on every resource access check
+let allowedResourceDirs: { dataDir: string | undefined; dirs: string[] } | undefined;
+
+function getAllowedResourceDirectories(): string[] {
+  const dataDir = process.env['SCRYFALL_DATA_DIR'];
+  if (!allowedResourceDirs || allowedResourceDirs.dataDir !== dataDir) {
+    const dirs = [
+      '/tmp/scryfall_downloads',
+      '/tmp/scryfall_fallback',
+      dataDir,
+      tmpdir(),
+      join(homedir(), '.local')
+    ].filter((dir): dir is string => Boolean(dir)).map(dir => resolve(dir));
+    allowedResourceDirs = { dataDir, dirs };
+  }
+  return allowedResourceDirs.dirs;
+}
+
 export interface ResourceInfo {
   card_name: string;
   filename: string;
@@ -22,18 +67,24 @@ export interface ResourceInfo {
 export class FileManager {
   private db: CardDatabase | null = null;
   private ownsDb: boolean = false;
+  // Without an injected database the shared connection is re-fetched per operation
+  private readonly usesSharedDb: boolean;
 
   constructor(db?: CardDatabase) {
     this.db = db || null;
     this.ownsDb = !db;
+    this.usesSharedDb = !db;
   }
 
   /**
    * Initialize the file manager with database connection.
    */
   async init(): Promise<void> {
-    if (!this.db) {
-      this.db = await createCardDatabase();
+    if (this.usesSharedDb) {
+      // The shared connection is owned by the database module, not this file manager, and may
+      // have been replaced since the last call (data directory change or closeSharedCardDatabase)
+      this.db = await getSharedCardDatabase();
+      this.ownsDb = false;
     }
   }
 
@@ -48,18 +99,14 @@ export class FileManager {
    * Get the file path for a given file ID.
    */
   async getFilePath(fileId: string): Promise<string | undefined> {
-    if (!this.db) {
-      await this.init();
-    }
+    await this.init();
 
     const filePath = this.db!.getFilePathById(fileId);
     if (filePath) {
-      // Security check: ensure the path exists and is a file
-      if (existsSync(filePath)) {
-        const stats = statSync(filePath);
-        if (stats.isFile()) {
-          return filePath;
-        }
+      // Security check: ensure the path exists and is a file (a single stat covers both)
+      const stats = statSync(filePath, { throwIfNoEntry: false });
+      if (stats?.isFile()) {
+        return filePath;
       }
     }
     return undefined;
@@ -69,24 +116,19 @@ export class FileManager {
    * Determine the MIME type of a file.
    */
   getMimeType(filePath: string): string {
-    const mimeType = lookup(filePath);
-    if (mimeType) {
-      return mimeType;
+    const extension = extname(filePath).toLowerCase();
+    const knownType = EXTENSION_MIME_TYPES[extension];
+    if (knownType) {
+      return knownType;
     }
 
-    // Default MIME types for common extensions
-    const extension = extname(filePath).toLowerCase();
-    const mimeMap: Record<string, string> = {
-      '.jpg': 'image/jpeg',
-      '.jpeg': 'image/jpeg',
-      '.png': 'image/png',
-      '.gif': 'image/gif',
-      '.webp': 'image/webp',
-      '.json': 'application/json',
-      '.txt': 'text/plain'
-    };
-
-    return mimeMap[extension] || 'application/octet-stream';
+    // Fall back to the mime-types database, caching the answer per extension
+    let mimeType = mimeTypeCache.get(extension);
+    if (mimeType === undefined) {
+      mimeType = (extension && lookupMimeType(extension)) || 'application/octet-stream';
+      mimeTypeCache.set(extension, mimeType);
+    }
+    return mimeType;
   }
 
   /**
@@ -108,15 +150,15 @@ export class FileManager {
       }
 
       // Double-check file exists and is readable
+      let stats;
       try {
-        await stat(filePath);
+        stats = await stat(filePath);
       } catch (statError: any) {
         logger.error(`File not accessible: ${filePath} - ${statError.message}`);
         return undefined;
       }
 
       // Read file content with size validation
-      const stats = await stat(filePath);
       const maxFileSize = 50 * 1024 * 1024; // 50MB limit
       if (stats.size > maxFileSize) {
         logger.error(`File size exceeds limit: ${stats.size} bytes for ${filePath}`);
@@ -146,9 +188,7 @@ export class FileManager {
     imageUrl?: string
   ): Promise<string> {
     try {
-      if (!this.db) {
-        await this.init();
-      }
+      await this.init();
 
       // Validate inputs
       if (!filePath || !cardName) {
@@ -156,12 +196,12 @@ export class FileManager {
       }
 
       // Verify file exists before registering
-      if (!existsSync(filePath)) {
+      const stats = statSync(filePath, { throwIfNoEntry: false });
+      if (!stats) {
         throw new Error(`File does not exist: ${filePath}`);
       }
 
       // Validate file is actually a file (not directory)
-      const stats = statSync(filePath);
       if (!stats.isFile()) {
         throw new Error(`Path is not a file: ${filePath}`);
       }
@@ -203,10 +243,7 @@ export class FileManager {
    * Clean up old temporary files.
    */
   async cleanupTempFiles(directory: string, maxAgeHours: number = 24): Promise<number> {
-    if (!existsSync(directory)) {
-      return 0;
-    }
-
+    // walkDirectory yields nothing for a missing directory, so no existence pre-check is needed
     let deletedCount = 0;
     const currentTime = Date.now();
     const maxAgeMs = maxAgeHours * 3600 * 1000;
@@ -266,7 +303,7 @@ export class FileManager {
   async validateResourceAccess(resourceType: string, fileId: string): Promise<boolean> {
     try {
       // Ensure file_id is a valid UUID format
-      if (!isValidUuid(fileId)) {
+      if (!UUID_PATTERN.test(fileId)) {
         logger.warn(`Invalid UUID format for file access: ${fileId}`);
         return false;
       }
@@ -279,9 +316,7 @@ export class FileManager {
       }
 
       // Check if file exists in database
-      if (!this.db) {
-        await this.init();
-      }
+      await this.init();
 
       const cardInfo = this.db!.getCardByFileId(fileId);
       if (!cardInfo) {
@@ -289,28 +324,17 @@ export class FileManager {
         return false;
       }
 
-      // Check if physical file exists
+      // Check if physical file exists; the stat result is reused for the size check below
       const filePath = cardInfo.filename;
-      if (!existsSync(filePath)) {
+      const stats = statSync(filePath, { throwIfNoEntry: false });
+      if (!stats) {
         logger.warn(`Physical file does not exist: ${filePath}`);
         return false;
       }
 
       // Verify file is within allowed directories
-      const resolvedPath = require('path').resolve(filePath);
-      const allowedDirs = [
-        '/tmp/scryfall_downloads',
-        '/tmp/scryfall_fallback',
-        process.env['SCRYFALL_DATA_DIR'],
-        require('os').tmpdir(),
-        require('path').join(require('os').homedir(), '.local')
-      ].filter(Boolean);
-
-      const isInAllowedDir = allowedDirs.some(dir => {
-        if (!dir) return false;
-        const resolvedDir = require('path').resolve(dir);
-        return resolvedPath.startsWith(resolvedDir);
-      });
+      const resolvedPath = resolve(filePath);
+      const isInAllowedDir = getAllowedResourceDirectories().some(dir => resolvedPath.startsWith(dir));
 
       if (!isInAllowedDir) {
         logger.warn(`File path outside allowed directories: ${resolvedPath}`);
@@ -318,7 +342,6 @@ export class FileManager {
       }
 
       // Check file size limits (reasonable limits for card images)
-      const stats = statSync(filePath);
       const maxFileSize = 50 * 1024 * 1024; // 50MB limit
       if (stats.size > maxFileSize) {
         logger.warn(`File size exceeds limit: ${stats.size} bytes`);
@@ -346,12 +369,10 @@ export class FileManager {
    */
   async getResourceInfo(fileId: string): Promise<ResourceInfo | undefined> {
     try {
-      if (!this.db) {
-        await this.init();
-      }
+      await this.init();
 
       // Validate file ID format
-      if (!isValidUuid(fileId)) {
+      if (!UUID_PATTERN.test(fileId)) {
         logger.warn(`Invalid UUID format for resource info: ${fileId}`);
         return undefined;
       }
@@ -362,26 +383,25 @@ export class FileManager {
         return undefined;
       }
 
-      // Verify physical file exists
+      // Verify physical file exists with a single stat
       const filePath = cardInfo.filename;
-      if (!existsSync(filePath)) {
-        logger.warn(`Physical file missing for resource info: ${filePath}`);
-        return undefined;
-      }
-
-      // Get file stats for additional metadata
-      let fileStats;
       try {
-        fileStats = await stat(filePath);
+        await stat(filePath);
       } catch (statError: any) {
-        logger.error(`Failed to get file stats: ${statError.message}`);
+        if (statError.code === 'ENOENT') {
+          logger.warn(`Physical file missing for resource info: ${filePath}`);
+        } else {
+          logger.error(`Failed to get file stats: ${statError.message}`);
+        }
         return undefined;
       }
 
+      // Derive both the display name and the MIME type from the same basename
+      const filename = basename(filePath);
       const resourceInfo: ResourceInfo = {
         card_name: cardInfo.card_name,
-        filename: basename(cardInfo.filename),
-        mime_type: this.getMimeType(cardInfo.filename),
+        filename,
+        mime_type: this.getMimeType(filename),
         download_date: cardInfo.download_date,
         set_code: cardInfo.set_code || '',
         card_id: cardInfo.card_id || ''
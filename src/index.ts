@@ -9,6 +9,8 @@
 
 import { server, initializeServer } from './server.js';
 import { logger } from './logger.js';
+import { closeSharedCardDatabase } from './database.js';
+import { scryfallAgent } from './scryfallClient.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { fileURLToPath } from 'node:url';
@@ -181,12 +183,16 @@ async function main(): Promise<void> {
     process.on('SIGINT', async () => {
       logger.info('[Setup] Received SIGINT, shutting down gracefully...');
       await server.close();
+      await closeSharedCardDatabase();
+      scryfallAgent.destroy();
       process.exit(0);
     });
     
     process.on('SIGTERM', async () => {
       logger.info('[Setup] Received SIGTERM, shutting down gracefully...');
       await server.close();
+      await closeSharedCardDatabase();
+      scryfallAgent.destroy();
       process.exit(0);
     });
     
@@ -22,6 +22,9 @@ class Logger {
   private originalLevel: LogLevel;
   private isMcp: boolean;
   private temporaryLevelTimeout: NodeJS.Timeout | undefined;
+  // MCP-mode lines logged during one event loop turn are written to stderr together
+  private pendingLines: string[] = [];
+  private flushScheduled = false;
 
   constructor() {
     this.minLevel = process.env['NODE_ENV'] === 'production' ? LogLevel.INFO : LogLevel.DEBUG;
@@ -61,12 +64,13 @@ class Logger {
     const formattedMessage = this.formatMessage(levelName, message, ...args);
     
     if (this.isMcp) {
-      // In MCP mode, all output goes to stderr to avoid interfering with stdio protocol
-      try {
-        process.stderr.write(formattedMessage + '\n');
-      } catch (error) {
-        // Fallback: if stderr write fails, do nothing to prevent stdout pollution
-        // This prevents logger failures from crashing the server
+      // In MCP mode, all output goes to stderr to avoid interfering with stdio protocol.
+      // Lines are buffered and flushed once per event loop turn, so a burst of log calls
+      // during a batch download costs one write instead of one per line.
+      this.pendingLines.push(formattedMessage);
+      if (!this.flushScheduled) {
+        this.flushScheduled = true;
+        setImmediate(() => this.flush());
       }
     } else {
       // In standalone mode, use appropriate console methods
@@ -119,13 +123,18 @@ class Logger {
    * Flush any pending stderr writes
    */
   flush(): void {
+    this.flushScheduled = false;
+    if (this.pendingLines.length === 0) {
+      return;
+    }
+
+    const output = this.pendingLines.join('\n') + '\n';
+    this.pendingLines = [];
     try {
-      if (this.isMcp) {
-        // Force flush stderr buffer
-        process.stderr.write('');
-      }
+      process.stderr.write(output);
     } catch (error) {
-      // Ignore flush errors to prevent logger failures from crashing the server
+      // Fallback: if stderr write fails, do nothing to prevent stdout pollution
+      // This prevents logger failures from crashing the server
     }
   }
 
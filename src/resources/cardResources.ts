@@ -12,10 +12,10 @@ export async function cardById(cardId: string): Promise<[string, string]> {
   logger.info(`[Resource] Getting card data for ID: ${cardId}`);
 
   try {
-    // Fetch the card data from Scryfall
-    const cardData = await scryfallClient.getCardById(cardId);
+    // Pass Scryfall's JSON through as-is rather than parsing and re-serializing it
+    const cardJson = await scryfallClient.getCardJsonById(cardId);
     
-    return [JSON.stringify(cardData, null, 2), 'application/json'];
+    return [cardJson, 'application/json'];
   } catch (error) {
     logger.error('[Error] Failed to get card resource:', error);
     const errorResponse = {
@@ -33,10 +33,10 @@ export async function cardByName(cardName: string): Promise<[string, string]> {
   logger.info(`[Resource] Getting card data for name: ${cardName}`);
 
   try {
-    // Fetch the card data from Scryfall
-    const cardData = await scryfallClient.getCardByName(cardName);
+    // Pass Scryfall's JSON through as-is rather than parsing and re-serializing it
+    const cardJson = await scryfallClient.getCardJsonByName(cardName);
     
-    return [JSON.stringify(cardData, null, 2), 'application/json'];
+    return [cardJson, 'application/json'];
   } catch (error) {
     logger.error('[Error] Failed to get card resource by name:', error);
     const errorResponse = {
@@ -54,10 +54,10 @@ export async function randomCard(): Promise<[string, string]> {
   logger.info('[Resource] Getting a random card');
 
   try {
-    // Fetch a random card from Scryfall
-    const cardData = await scryfallClient.getRandomCard();
+    // Pass Scryfall's JSON through as-is rather than parsing and re-serializing it
+    const cardJson = await scryfallClient.getRandomCardJson();
     
-    return [JSON.stringify(cardData, null, 2), 'application/json'];
+    return [cardJson, 'application/json'];
   } catch (error) {
     logger.error('[Error] Failed to get random card:', error);
     const errorResponse = {
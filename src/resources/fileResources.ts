@@ -4,11 +4,24 @@
 
 import { readFile } from 'node:fs/promises';
 import { join, extname } from 'node:path';
-import { existsSync } from 'node:fs';
 import { createFileManager } from '../fileManager.js';
-import { createCardDatabase } from '../database.js';
+import { getSharedCardDatabase } from '../database.js';
 import { logger } from '../logger.js';
 
+/**
+ * Read a metadata file, returning undefined if it does not exist (one open instead of stat + open).
+ */
+async function readOptionalFile(filePath: string): Promise<string | undefined> {
+  try {
+    return await readFile(filePath, 'utf-8');
+  } catch (error: any) {
+    if (error.code === 'ENOENT') {
+      return undefined;
+    }
+    throw error;
+  }
+}
+
 /**
  * Serve a downloaded card image by file ID.
  */
@@ -19,40 +32,36 @@ export async function serveCardImage(fileId: string): Promise<[Buffer | string,
     const fm = await createFileManager();
     try {
       // Check if this might be a transform card by looking for face 0 by default
-      const db = await createCardDatabase();
+      const db = await getSharedCardDatabase();
       let cardInfo;
-      try {
-        cardInfo = db.getCardByFileId(fileId);
-        if (!cardInfo) {
-          // Check if there's a face 0 for this base file ID
-          const result = await fm.readFileContent(fileId);
-          if (result) {
-            const [content, mimeType] = result;
-            return [content, mimeType];
-          } else {
-            const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
-            return [JSON.stringify(errorMsg), 'application/json'];
-          }
+      cardInfo = db.getCardByFileId(fileId);
+      if (!cardInfo) {
+        // Check if there's a face 0 for this base file ID
+        const result = await fm.readFileContent(fileId);
+        if (result) {
+          const [content, mimeType] = result;
+          return [content, mimeType];
+        } else {
+          const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
+          return [JSON.stringify(errorMsg), 'application/json'];
         }
-        
-        // Check if this card is part of a transform card
-        const isTransform = db.isTransformCard(cardInfo.card_name);
-        if (isTransform) {
-          // For transform cards, default to face 0
-          return await serveCardImageFace(fileId, 0);
+      }
+      
+      // Check if this card is part of a transform card
+      const isTransform = db.isTransformCard(cardInfo.card_name);
+      if (isTransform) {
+        // For transform cards, default to face 0
+        return await serveCardImageFace(fileId, 0);
+      } else {
+        // Single-faced card - use existing behavior
+        const result = await fm.readFileContent(fileId);
+        if (result) {
+          const [content, mimeType] = result;
+          return [content, mimeType];
         } else {
-          // Single-faced card - use existing behavior
-          const result = await fm.readFileContent(fileId);
-          if (result) {
-            const [content, mimeType] = result;
-            return [content, mimeType];
-          } else {
-            const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
-            return [JSON.stringify(errorMsg), 'application/json'];
-          }
+          const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
+          return [JSON.stringify(errorMsg), 'application/json'];
         }
-      } finally {
-        db.close();
       }
     } finally {
       fm.close();
@@ -77,40 +86,36 @@ export async function serveArtCrop(fileId: string): Promise<[Buffer | string, st
     const fm = await createFileManager();
     try {
       // Check if this might be a transform card by looking for face 0 by default
-      const db = await createCardDatabase();
+      const db = await getSharedCardDatabase();
       let cardInfo;
-      try {
-        cardInfo = db.getCardByFileId(fileId);
-        if (!cardInfo) {
-          // Try direct file access
-          const result = await fm.readFileContent(fileId);
-          if (result) {
-            const [content, mimeType] = result;
-            return [content, mimeType];
-          } else {
-            const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
-            return [JSON.stringify(errorMsg), 'application/json'];
-          }
+      cardInfo = db.getCardByFileId(fileId);
+      if (!cardInfo) {
+        // Try direct file access
+        const result = await fm.readFileContent(fileId);
+        if (result) {
+          const [content, mimeType] = result;
+          return [content, mimeType];
+        } else {
+          const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
+          return [JSON.stringify(errorMsg), 'application/json'];
         }
-        
-        // Check if this card is part of a transform card
-        const isTransform = db.isTransformCard(cardInfo.card_name);
-        if (isTransform) {
-          // For transform cards, default to face 0
-          return await serveArtCropFace(fileId, 0);
+      }
+      
+      // Check if this card is part of a transform card
+      const isTransform = db.isTransformCard(cardInfo.card_name);
+      if (isTransform) {
+        // For transform cards, default to face 0
+        return await serveArtCropFace(fileId, 0);
+      } else {
+        // Single-faced card - use existing behavior
+        const result = await fm.readFileContent(fileId);
+        if (result) {
+          const [content, mimeType] = result;
+          return [content, mimeType];
         } else {
-          // Single-faced card - use existing behavior
-          const result = await fm.readFileContent(fileId);
-          if (result) {
-            const [content, mimeType] = result;
-            return [content, mimeType];
-          } else {
-            const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
-            return [JSON.stringify(errorMsg), 'application/json'];
-          }
+          const errorMsg = { status: 'error', message: `File not found for ID: ${fileId}` };
+          return [JSON.stringify(errorMsg), 'application/json'];
         }
-      } finally {
-        db.close();
       }
     } finally {
       fm.close();
@@ -134,37 +139,33 @@ export async function serveMetadata(fileId: string): Promise<[string, string]> {
   try {
     const fm = await createFileManager();
     try {
-      const db = await createCardDatabase();
-      try {
-        const cardInfo = db.getCardByFileId(fileId);
-        if (!cardInfo) {
-          const errorMsg = { status: 'error', message: `Metadata not found for ID: ${fileId}` };
-          return [JSON.stringify(errorMsg), 'application/json'];
-        }
-        
-        // Check if this card is part of a transform card
-        const isTransform = db.isTransformCard(cardInfo.card_name);
-        if (isTransform) {
-          // For transform cards, default to face 0
-          return await serveMetadataFace(fileId, 0);
-        } else {
-          // Single-faced card - check if it's an art crop
-          if (cardInfo.card_name.includes('_art_crop')) {
-            // This is an art crop, try to find the JSON file
-            const imagePath = cardInfo.filename;
-            const jsonPath = imagePath.replace(extname(imagePath), '.json');
+      const db = await getSharedCardDatabase();
+      const cardInfo = db.getCardByFileId(fileId);
+      if (!cardInfo) {
+        const errorMsg = { status: 'error', message: `Metadata not found for ID: ${fileId}` };
+        return [JSON.stringify(errorMsg), 'application/json'];
+      }
+      
+      // Check if this card is part of a transform card
+      const isTransform = db.isTransformCard(cardInfo.card_name);
+      if (isTransform) {
+        // For transform cards, default to face 0
+        return await serveMetadataFace(fileId, 0);
+      } else {
+        // Single-faced card - check if it's an art crop
+        if (cardInfo.card_name.includes('_art_crop')) {
+          // This is an art crop, try to find the JSON file
+          const imagePath = cardInfo.filename;
+          const jsonPath = imagePath.replace(extname(imagePath), '.json');
 
-            if (existsSync(jsonPath)) {
-              const content = await readFile(jsonPath, 'utf-8');
-              return [content, 'application/json'];
-            }
+          const content = await readOptionalFile(jsonPath);
+          if (content !== undefined) {
+            return [content, 'application/json'];
           }
-
-          const errorMsg = { status: 'error', message: `Metadata file not found for ID: ${fileId}` };
-          return [JSON.stringify(errorMsg), 'application/json'];
         }
-      } finally {
-        db.close();
+
+        const errorMsg = { status: 'error', message: `Metadata file not found for ID: ${fileId}` };
+        return [JSON.stringify(errorMsg), 'application/json'];
       }
     } finally {
       fm.close();
@@ -186,38 +187,34 @@ export async function serveCardImageFace(fileId: string, faceIndex: number): Pro
   logger.info(`[Resource] Serving card image face ${faceIndex} for file ID: ${fileId}`);
 
   try {
-    const db = await createCardDatabase();
-    try {
-      // Get the base card info to determine the card name
-      const baseCardInfo = db.getCardByFileId(fileId);
-      if (!baseCardInfo) {
-        const errorMsg = { status: 'error', message: `Card not found for file ID: ${fileId}` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
+    const db = await getSharedCardDatabase();
+    // Get the base card info to determine the card name
+    const baseCardInfo = db.getCardByFileId(fileId);
+    if (!baseCardInfo) {
+      const errorMsg = { status: 'error', message: `Card not found for file ID: ${fileId}` };
+      return [JSON.stringify(errorMsg), 'application/json'];
+    }
 
-      // Get the face-specific card info
-      const faceCardInfo = db.getCardFaceInfo(baseCardInfo.card_name, faceIndex);
-      if (!faceCardInfo) {
-        const errorMsg = { status: 'error', message: `Face ${faceIndex} not found for card: ${baseCardInfo.card_name}` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
+    // Get the face-specific card info
+    const faceCardInfo = db.getCardFaceInfo(baseCardInfo.card_name, faceIndex);
+    if (!faceCardInfo) {
+      const errorMsg = { status: 'error', message: `Face ${faceIndex} not found for card: ${baseCardInfo.card_name}` };
+      return [JSON.stringify(errorMsg), 'application/json'];
+    }
 
-      // Use the face-specific file ID to get the content
-      const fm = await createFileManager();
-      try {
-        const result = await fm.readFileContent(faceCardInfo.file_id);
-        if (result) {
-          const [content, mimeType] = result;
-          return [content, mimeType];
-        } else {
-          const errorMsg = { status: 'error', message: `File not found for face ${faceIndex} of card: ${baseCardInfo.card_name}` };
-          return [JSON.stringify(errorMsg), 'application/json'];
-        }
-      } finally {
-        fm.close();
+    // Use the face-specific file ID to get the content
+    const fm = await createFileManager();
+    try {
+      const result = await fm.readFileContent(faceCardInfo.file_id);
+      if (result) {
+        const [content, mimeType] = result;
+        return [content, mimeType];
+      } else {
+        const errorMsg = { status: 'error', message: `File not found for face ${faceIndex} of card: ${baseCardInfo.card_name}` };
+        return [JSON.stringify(errorMsg), 'application/json'];
       }
     } finally {
-      db.close();
+      fm.close();
     }
   } catch (error) {
     logger.error(`[Error] Failed to serve card image face ${faceIndex}:`, error);
@@ -236,38 +233,34 @@ export async function serveArtCropFace(fileId: string, faceIndex: number): Promi
   logger.info(`[Resource] Serving art crop face ${faceIndex} for file ID: ${fileId}`);
 
   try {
-    const db = await createCardDatabase();
-    try {
-      // Get the base card info to determine the card name
-      const baseCardInfo = db.getCardByFileId(fileId);
-      if (!baseCardInfo) {
-        const errorMsg = { status: 'error', message: `Card not found for file ID: ${fileId}` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
+    const db = await getSharedCardDatabase();
+    // Get the base card info to determine the card name
+    const baseCardInfo = db.getCardByFileId(fileId);
+    if (!baseCardInfo) {
+      const errorMsg = { status: 'error', message: `Card not found for file ID: ${fileId}` };
+      return [JSON.stringify(errorMsg), 'application/json'];
+    }
 
-      // Get the face-specific card info (look for art crop variant)
-      const faceCardInfo = db.getCardFaceInfo(baseCardInfo.card_name, faceIndex);
-      if (!faceCardInfo) {
-        const errorMsg = { status: 'error', message: `Art crop face ${faceIndex} not found for card: ${baseCardInfo.card_name}` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
+    // Get the face-specific card info (look for art crop variant)
+    const faceCardInfo = db.getCardFaceInfo(baseCardInfo.card_name, faceIndex);
+    if (!faceCardInfo) {
+      const errorMsg = { status: 'error', message: `Art crop face ${faceIndex} not found for card: ${baseCardInfo.card_name}` };
+      return [JSON.stringify(errorMsg), 'application/json'];
+    }
 
-      // Use the face-specific file ID to get the content
-      const fm = await createFileManager();
-      try {
-        const result = await fm.readFileContent(faceCardInfo.file_id);
-        if (result) {
-          const [content, mimeType] = result;
-          return [content, mimeType];
-        } else {
-          const errorMsg = { status: 'error', message: `Art crop file not found for face ${faceIndex} of card: ${baseCardInfo.card_name}` };
-          return [JSON.stringify(errorMsg), 'application/json'];
-        }
-      } finally {
-        fm.close();
+    // Use the face-specific file ID to get the content
+    const fm = await createFileManager();
+    try {
+      const result = await fm.readFileContent(faceCardInfo.file_id);
+      if (result) {
+        const [content, mimeType] = result;
+        return [content, mimeType];
+      } else {
+        const errorMsg = { status: 'error', message: `Art crop file not found for face ${faceIndex} of card: ${baseCardInfo.card_name}` };
+        return [JSON.stringify(errorMsg), 'application/json'];
       }
     } finally {
-      db.close();
+      fm.close();
     }
   } catch (error) {
     logger.error(`[Error] Failed to serve art crop face ${faceIndex}:`, error);
@@ -286,41 +279,37 @@ export async function serveMetadataFace(fileId: string, faceIndex: number): Prom
   logger.info(`[Resource] Serving metadata face ${faceIndex} for file ID: ${fileId}`);
 
   try {
-    const db = await createCardDatabase();
-    try {
-      // Get the base card info to determine the card name
-      const baseCardInfo = db.getCardByFileId(fileId);
-      if (!baseCardInfo) {
-        const errorMsg = { status: 'error', message: `Card not found for file ID: ${fileId}` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
+    const db = await getSharedCardDatabase();
+    // Get the base card info to determine the card name
+    const baseCardInfo = db.getCardByFileId(fileId);
+    if (!baseCardInfo) {
+      const errorMsg = { status: 'error', message: `Card not found for file ID: ${fileId}` };
+      return [JSON.stringify(errorMsg), 'application/json'];
+    }
 
-      // Get the face-specific card info
-      const faceCardInfo = db.getCardFaceInfo(baseCardInfo.card_name, faceIndex);
-      if (!faceCardInfo) {
-        const errorMsg = { status: 'error', message: `Metadata face ${faceIndex} not found for card: ${baseCardInfo.card_name}` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
+    // Get the face-specific card info
+    const faceCardInfo = db.getCardFaceInfo(baseCardInfo.card_name, faceIndex);
+    if (!faceCardInfo) {
+      const errorMsg = { status: 'error', message: `Metadata face ${faceIndex} not found for card: ${baseCardInfo.card_name}` };
+      return [JSON.stringify(errorMsg), 'application/json'];
+    }
 
-      // Check if this is an art crop (metadata only exists for art crops)
-      if (!faceCardInfo.card_name.includes('_art_crop')) {
-        const errorMsg = { status: 'error', message: `Metadata is only available for art crop images. Face ${faceIndex} is not an art crop.` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
+    // Check if this is an art crop (metadata only exists for art crops)
+    if (!faceCardInfo.card_name.includes('_art_crop')) {
+      const errorMsg = { status: 'error', message: `Metadata is only available for art crop images. Face ${faceIndex} is not an art crop.` };
+      return [JSON.stringify(errorMsg), 'application/json'];
+    }
 
-      // Find the corresponding JSON file for this face
-      const imagePath = faceCardInfo.filename;
-      const jsonPath = imagePath.replace(extname(imagePath), '.json');
+    // Find the corresponding JSON file for this face
+    const imagePath = faceCardInfo.filename;
+    const jsonPath = imagePath.replace(extname(imagePath), '.json');
 
-      if (existsSync(jsonPath)) {
-        const content = await readFile(jsonPath, 'utf-8');
-        return [content, 'application/json'];
-      } else {
-        const errorMsg = { status: 'error', message: `Metadata file not found for face ${faceIndex} of card: ${baseCardInfo.card_name}` };
-        return [JSON.stringify(errorMsg), 'application/json'];
-      }
-    } finally {
-      db.close();
+    const content = await readOptionalFile(jsonPath);
+    if (content !== undefined) {
+      return [content, 'application/json'];
+    } else {
+      const errorMsg = { status: 'error', message: `Metadata file not found for face ${faceIndex} of card: ${baseCardInfo.card_name}` };
+      return [JSON.stringify(errorMsg), 'application/json'];
     }
   } catch (error) {
     logger.error(`[Error] Failed to serve metadata face ${faceIndex}:`, error);
@@ -2,9 +2,46 @@
  * Scryfall API client for Magic: The Gathering card data.
  */
 
+import { Agent } from 'node:https';
 import fetch from 'node-fetch';
 import { logger } from './logger.js';
 
+/**
+ * Shared keep-alive agent so consecutive Scryfall requests reuse TLS connections.
+ */
+export const scryfallAgent = new Agent({ keepAlive: true, maxSockets: 4 });
+
+// Scryfall asks clients to identify themselves; image downloads send the same User-Agent
+export const SCRYFALL_USER_AGENT = 'scryfall-mcp-server/1.0';
+
+// API requests also ask for JSON explicitly (node-fetch adds Accept-Encoding: gzip, deflate, br)
+const SCRYFALL_HEADERS = {
+  'User-Agent': SCRYFALL_USER_AGENT,
+  'Accept': 'application/json'
+};
+
+const REQUEST_TIMEOUT_MS = 10000;
+
+// Card-by-ID responses are cached; random cards are never cached
+const CARD_CACHE_TTL_MS = 60 * 60 * 1000;
+const CARD_CACHE_MAX_ENTRIES = 1024;
+
+// Search results are reused for identical queries within the TTL, skipping every page request
+const SEARCH_CACHE_TTL_MS = 10 * 60 * 1000;
+const SEARCH_CACHE_MAX_ENTRIES = 256;
+// Memory is bounded by cards held across all queries (a card's JSON is a few KB, so ~10 MB);
+// broad queries returning more than the per-result limit are not cached at all
+const SEARCH_CACHE_MAX_CARDS = 2000;
+const SEARCH_CACHE_MAX_RESULT_CARDS = 500;
+
+// Single-card bodies kept for If-None-Match revalidation; a 304 reply reuses them without a payload.
+// Search pages are not revalidated, so each entry stays one card's JSON (a few KB)
+const ETAG_CACHE_MAX_ENTRIES = 256;
+
+// Token bucket: sustained Scryfall rate (requests/second) and how many may start back to back
+const RATE_LIMIT_PER_SECOND = 10;
+const RATE_LIMIT_BURST = 2;
+
 export interface Card {
   id: string;
   name: string;
@@ -38,42 +75,114 @@ export interface SearchResponse {
   details?: string;
 }
 
+/**
+ * Raised when Scryfall answers 404; a missing card or an empty search is not worth retrying.
+ */
+export class ScryfallNotFoundError extends Error {
+  readonly url: string;
+
+  constructor(url: string) {
+    super(`Not found: ${url}`);
+    this.name = 'ScryfallNotFoundError';
+    this.url = url;
+  }
+}
+
+/**
+ * Signature of the fetch used for API requests; tests pass a fake that serves canned responses.
+ */
+export type FetchFunction = typeof fetch;
+
 export class ScryfallClient {
   private readonly baseUrl = 'https://api.scryfall.com';
-  private readonly rateLimitDelay = 200; // 200ms between requests
+  private readonly retryDelay = 200; // 200ms before retrying a failed request
+  private tokens = RATE_LIMIT_BURST;
+  private lastRefillAt = Date.now();
+  private readonly fetchImpl: FetchFunction;
+  private readonly cardCache = new Map<string, { body: string; expiresAt: number }>();
+  private readonly searchCache = new Map<string, { body: string; cardCount: number; expiresAt: number }>();
+  private searchCacheCards = 0;
+  private readonly etagCache = new Map<string, { etag: string; body: string }>();
+
+  constructor(fetchImpl?: FetchFunction) {
+    this.fetchImpl = fetchImpl || fetch;
+  }
 
   /**
-   * Add a delay between requests to respect rate limits.
+   * Wait before retrying a request, by default for the fixed retry delay.
    */
-  private async delay(): Promise<void> {
-    return new Promise(resolve => setTimeout(resolve, this.rateLimitDelay));
+  private async delay(ms: number = this.retryDelay): Promise<void> {
+    return new Promise(resolve => setTimeout(resolve, ms));
   }
 
   /**
-   * Make a request to the Scryfall API with retry logic.
+   * Take a token from the shared bucket, waiting for a refill if it is empty.
+   * Tokens may go negative so concurrent callers reserve successive slots instead of racing.
+   * Image downloads call this too, so API and image requests share one rate limit.
    */
-  private async makeRequest<T>(url: string, retries = 3): Promise<T> {
+  async throttle(): Promise<void> {
+    const now = Date.now();
+    this.tokens = Math.min(
+      RATE_LIMIT_BURST,
+      this.tokens + ((now - this.lastRefillAt) * RATE_LIMIT_PER_SECOND) / 1000
+    );
+    this.lastRefillAt = now;
+    this.tokens -= 1;
+    if (this.tokens < 0) {
+      await this.delay((-this.tokens * 1000) / RATE_LIMIT_PER_SECOND);
+    }
+  }
+
+  /**
+   * Make a request to the Scryfall API and parse the JSON body.
+   */
+  private async makeRequest<T>(url: string, retries = 3, revalidate = true): Promise<T> {
+    return JSON.parse(await this.makeTextRequest(url, retries, revalidate)) as T;
+  }
+
+  /**
+   * Make a request to the Scryfall API with retry logic, returning the raw JSON text.
+   * When revalidate is set, a previously seen ETag is sent so unchanged responses come back as 304.
+   */
+  private async makeTextRequest(url: string, retries = 3, revalidate = true): Promise<string> {
     for (let attempt = 1; attempt <= retries; attempt++) {
       try {
-        const response = await fetch(url);
+        const cached = revalidate ? this.etagCache.get(url) : undefined;
+        await this.throttle();
+        const response = await this.fetchImpl(url, {
+          agent: scryfallAgent,
+          headers: cached ? { ...SCRYFALL_HEADERS, 'If-None-Match': cached.etag } : SCRYFALL_HEADERS,
+          signal: AbortSignal.timeout(REQUEST_TIMEOUT_MS)
+        });
+
+        if (response.status === 304 && cached) {
+          logger.debug(`Not modified, reusing cached response: ${url}`);
+          this.rememberEtag(url, cached);
+          return cached.body;
+        }
         
+        if (response.status === 429 && attempt < retries) {
+          const retryAfterMs = Number(response.headers.get('retry-after')) * 1000 || 1000;
+          logger.warn(`Rate limited by Scryfall, retrying in ${retryAfterMs}ms: ${url}`);
+          await this.delay(retryAfterMs);
+          continue;
+        }
+
         if (!response.ok) {
           if (response.status === 404) {
-            throw new Error(`Not found: ${url}`);
+            throw new ScryfallNotFoundError(url);
           }
           throw new Error(`HTTP ${response.status}: ${response.statusText}`);
         }
 
-        const data = await response.json() as T;
-        
-        // Add delay after successful request
-        if (attempt < retries) {
-          await this.delay();
+        const body = await response.text();
+        const etag = response.headers.get('etag');
+        if (revalidate && etag) {
+          this.rememberEtag(url, { etag, body });
         }
-        
-        return data;
+        return body;
       } catch (error) {
-        if (attempt === retries) {
+        if (attempt === retries || error instanceof ScryfallNotFoundError) {
           throw error;
         }
         
@@ -85,10 +194,39 @@ export class ScryfallClient {
     throw new Error('All retry attempts failed');
   }
 
+  /**
+   * Store a response for conditional revalidation, evicting the least recently used entry when full.
+   */
+  private rememberEtag(url: string, entry: { etag: string; body: string }): void {
+    this.etagCache.delete(url);
+    this.etagCache.set(url, entry);
+    if (this.etagCache.size > ETAG_CACHE_MAX_ENTRIES) {
+      const oldest = this.etagCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.etagCache.delete(oldest);
+      }
+    }
+  }
+
   /**
    * Search for cards using Scryfall's search API.
+   * Results for a query are cached for ten minutes, including searches that found nothing.
    */
   async searchCards(query: string): Promise<Card[]> {
+    const now = Date.now();
+    const cached = this.searchCache.get(query);
+    if (cached && cached.expiresAt > now) {
+      // Re-insert so the map stays ordered from least to most recently used
+      this.searchCache.delete(query);
+      this.searchCache.set(query, cached);
+      logger.debug(`Search cache hit for: ${query}`);
+      // Parse fresh objects, since grouping labels the cards it is given
+      return JSON.parse(cached.body) as Card[];
+    }
+    if (cached) {
+      this.forgetSearch(query);
+    }
+
     const encodedQuery = encodeURIComponent(query);
     const searchUrl = `${this.baseUrl}/cards/search?q=${encodedQuery}`;
     
@@ -99,7 +237,8 @@ export class ScryfallClient {
 
     try {
       while (currentUrl) {
-        const data: SearchResponse = await this.makeRequest<SearchResponse>(currentUrl);
+        // Pages are not kept for revalidation; whole result sets are cached by query instead
+        const data: SearchResponse = await this.makeRequest<SearchResponse>(currentUrl, 3, false);
         
         if (data.object === 'error') {
           throw new Error(data.details || 'Unknown API error');
@@ -118,10 +257,12 @@ export class ScryfallClient {
       }
 
       logger.info(`Found ${allCards.length} cards`);
+      this.rememberSearch(query, allCards, now);
       return allCards;
     } catch (error) {
-      if (error instanceof Error && error.message.includes('Not found')) {
+      if (error instanceof ScryfallNotFoundError) {
         logger.info(`No cards found for query: ${query}`);
+        this.rememberSearch(query, [], now);
         return [];
       }
       
@@ -130,14 +271,76 @@ export class ScryfallClient {
     }
   }
 
+  /**
+   * Cache a query's results, evicting least recently used queries until the entry and card limits hold.
+   */
+  private rememberSearch(query: string, cards: Card[], now: number): void {
+    this.forgetSearch(query);
+    if (cards.length > SEARCH_CACHE_MAX_RESULT_CARDS) {
+      logger.debug(`Not caching ${cards.length} results for: ${query}`);
+      return;
+    }
+
+    this.searchCache.set(query, { body: JSON.stringify(cards), cardCount: cards.length, expiresAt: now + SEARCH_CACHE_TTL_MS });
+    this.searchCacheCards += cards.length;
+    while (this.searchCache.size > SEARCH_CACHE_MAX_ENTRIES || this.searchCacheCards > SEARCH_CACHE_MAX_CARDS) {
+      const oldest = this.searchCache.keys().next().value;
+      if (oldest === undefined) {
+        break;
+      }
+      this.forgetSearch(oldest);
+    }
+  }
+
+  /**
+   * Drop a query from the search cache, keeping the cached card total in step.
+   */
+  private forgetSearch(query: string): void {
+    const entry = this.searchCache.get(query);
+    if (entry) {
+      this.searchCache.delete(query);
+      this.searchCacheCards -= entry.cardCount;
+    }
+  }
+
   /**
    * Get a card by its Scryfall ID.
    */
   async getCardById(cardId: string): Promise<Card> {
-    const url = `${this.baseUrl}/cards/${cardId}`;
     logger.debug(`Getting card by ID: ${cardId}`);
     
-    return await this.makeRequest<Card>(url);
+    // Parse a fresh object from the cached text so callers can't mutate each other's cards
+    return JSON.parse(await this.getCardJsonById(cardId)) as Card;
+  }
+
+  /**
+   * Get a card by its Scryfall ID as the JSON text returned by the API, without parsing it.
+   * Responses are cached for an hour since card data for a given ID rarely changes.
+   */
+  async getCardJsonById(cardId: string): Promise<string> {
+    const now = Date.now();
+    const cached = this.cardCache.get(cardId);
+    if (cached && cached.expiresAt > now) {
+      // Re-insert so the map stays ordered from least to most recently used
+      this.cardCache.delete(cardId);
+      this.cardCache.set(cardId, cached);
+      logger.debug(`Card cache hit for ID: ${cardId}`);
+      return cached.body;
+    }
+
+    const url = `${this.baseUrl}/cards/${cardId}`;
+    logger.debug(`Getting card JSON by ID: ${cardId}`);
+    
+    const body = await this.makeTextRequest(url);
+    this.cardCache.delete(cardId);
+    this.cardCache.set(cardId, { body, expiresAt: now + CARD_CACHE_TTL_MS });
+    if (this.cardCache.size > CARD_CACHE_MAX_ENTRIES) {
+      const oldest = this.cardCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.cardCache.delete(oldest);
+      }
+    }
+    return body;
   }
 
   /**
@@ -151,6 +354,17 @@ export class ScryfallClient {
     return await this.makeRequest<Card>(url);
   }
 
+  /**
+   * Get a card by its exact name as the JSON text returned by the API, without parsing it.
+   */
+  async getCardJsonByName(cardName: string): Promise<string> {
+    const encodedName = encodeURIComponent(cardName);
+    const url = `${this.baseUrl}/cards/named?exact=${encodedName}`;
+    logger.debug(`Getting card JSON by name: ${cardName}`);
+    
+    return await this.makeTextRequest(url);
+  }
+
   /**
    * Get a random card.
    */
@@ -158,7 +372,18 @@ export class ScryfallClient {
     const url = `${this.baseUrl}/cards/random`;
     logger.debug('Getting random card');
     
-    return await this.makeRequest<Card>(url);
+    // Every call should return a new card, so there is nothing to revalidate
+    return await this.makeRequest<Card>(url, 3, false);
+  }
+
+  /**
+   * Get a random card as the JSON text returned by the API, without parsing it.
+   */
+  async getRandomCardJson(): Promise<string> {
+    const url = `${this.baseUrl}/cards/random`;
+    logger.debug('Getting random card JSON');
+    
+    return await this.makeTextRequest(url, 3, false);
   }
 
   /**
@@ -18,6 +18,7 @@ import {
 } from './tools/searchTools.js';
 import {
   mcpDownloadCard,
+  mcpDownloadCards,
   mcpDownloadArtCrop
 } from './tools/downloadTools.js';
 import {
@@ -48,6 +49,14 @@ import {
 import { logger } from './logger.js';
 import { getStorageDirectory, ensureDirectoryPermissions, isMcpMode } from './config.js';
 
+/**
+ * Encode binary resource content as the base64 string MCP expects for blobs.
+ * A Buffer left in the response would be serialized by JSON.stringify as an array of byte numbers.
+ */
+function toBase64Blob(content: Buffer | string): string {
+  return (typeof content === 'string' ? Buffer.from(content) : content).toString('base64');
+}
+
 // Create the MCP server
 export const server = new Server({
   name: 'scryfall-server',
@@ -98,23 +107,13 @@ export async function initializeServer() {
         fileOperationsAvailable = false;
       }
     }
-    
-    // Verify required subdirectories can be created (only if file operations are available)
-    if (fileOperationsAvailable && storageDir) {
-      try {
-        const cardImagesDir = await getStorageDirectory('scryfall_card_images');
-        const artCropsDir = await getStorageDirectory('scryfall_images');
-        logger.info(`[Setup] Subdirectories verified: card images (${cardImagesDir}), art crops (${artCropsDir})`);
-      } catch (subdirError: any) {
-        logger.warn(`[Setup] Failed to create required subdirectories: ${subdirError.message}`);
-        logger.warn('[Setup] File downloads will be disabled - server will continue with API-only functionality');
-        fileOperationsAvailable = false;
-      }
-    }
-    
+
     // Log the final status of file operations
     if (fileOperationsAvailable) {
       logger.info('[Setup] ✓ File download functionality is available');
+      // Card image and art crop subdirectories are created lazily by getCardImagesDirectory /
+      // getArtCropsDirectory on first download, keeping startup free of extra mkdir calls
+      logger.info('[Setup] Download subdirectories will be created on first use');
     } else {
       logger.info('[Setup] ⚠ File download functionality is disabled - server will provide search and API access only');
     }
@@ -197,6 +196,36 @@ server.setRequestHandler(ListToolsRequestSchema, async () => {
           required: ['card_name']
         }
       },
+      {
+        name: 'mcp_download_cards',
+        description: 'Download high-resolution images of several Magic: The Gathering cards in one call. Cards are downloaded concurrently',
+        inputSchema: {
+          type: 'object',
+          properties: {
+            card_names: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'The names of the cards to download'
+            },
+            set_codes: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Optional set codes, matched to card_names by position'
+            },
+            collector_numbers: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Optional collector numbers, matched to card_names by position'
+            },
+            force_download: {
+              type: 'boolean',
+              description: 'Whether to force download even if the cards already exist',
+              default: false
+            }
+          },
+          required: ['card_names']
+        }
+      },
       {
         name: 'mcp_download_art_crop',
         description: 'Download an art crop image of a specific Magic: The Gathering card. Supports transform cards (downloads all faces automatically)',
@@ -333,6 +362,25 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
           ]
         };
 
+      case 'mcp_download_cards':
+        return {
+          content: [
+            {
+              type: 'text',
+              text: JSON.stringify(
+                await mcpDownloadCards(
+                  args?.['card_names'] as string[],
+                  args?.['set_codes'] as string[] | undefined,
+                  args?.['collector_numbers'] as string[] | undefined,
+                  (args?.['force_download'] as boolean) || false
+                ),
+                null,
+                2
+              )
+            }
+          ]
+        };
+
       case 'mcp_download_art_crop':
         return {
           content: [
@@ -568,7 +616,7 @@ server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
             {
               uri,
               mimeType,
-              blob: content instanceof Buffer ? content : Buffer.from(content)
+              blob: toBase64Blob(content)
             }
           ]
         };
@@ -580,7 +628,7 @@ server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
             {
               uri,
               mimeType,
-              blob: content instanceof Buffer ? content : Buffer.from(content)
+              blob: toBase64Blob(content)
             }
           ]
         };
@@ -600,7 +648,7 @@ server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
             {
               uri,
               mimeType,
-              blob: content instanceof Buffer ? content : Buffer.from(content)
+              blob: toBase64Blob(content)
             }
           ]
         };
@@ -612,7 +660,7 @@ server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
             {
               uri,
               mimeType,
-              blob: content instanceof Buffer ? content : Buffer.from(content)
+              blob: toBase64Blob(content)
             }
           ]
         };
@@ -2,8 +2,7 @@
  * Download-related MCP tools for the Scryfall server.
  */
 
-import { downloadManager } from '../downloadManager.js';
-import { createCardDatabase } from '../database.js';
+import { downloadManager, DownloadResult as ManagerDownloadResult } from '../downloadManager.js';
 import { getStorageDirectory } from '../config.js';
 import { logger } from '../logger.js';
 
@@ -23,6 +22,135 @@ export interface DownloadResult {
   faces?: DownloadResult[];
 }
 
+export interface BatchDownloadResult {
+  status: 'success' | 'error';
+  message: string;
+  count?: number;
+  results?: DownloadResult[];
+}
+
+/**
+ * Shape the files downloaded for one card into a tool result.
+ * Returns response structure matching Python implementation.
+ */
+function buildCardDownloadResult(
+  trimmedCardName: string,
+  downloadedFiles: ManagerDownloadResult[],
+  setCode?: string,
+  collectorNumber?: string
+): DownloadResult {
+  if (downloadedFiles.length > 0) {
+    const isTransformCard = downloadedFiles.length > 1;
+    
+    if (isTransformCard) {
+      // Handle transform card with multiple faces
+      const faces: DownloadResult[] = [];
+      let hasError = false;
+      
+      for (const file of downloadedFiles) {
+        try {
+          // The download manager returns the file_id it registered for each face
+          const fileId = file.fileId;
+          
+          const faceResult: DownloadResult = {
+            status: 'success',
+            message: `Face ${file.face_index} (${file.face_name}) downloaded successfully`,
+            filepath: file.filePath,
+            card_name: file.cardName,
+            face_index: file.face_index,
+            face_name: file.face_name,
+            total_faces: file.total_faces,
+            is_transform_card: file.is_transform_card
+          };
+          
+          // Add optional fields
+          if (setCode !== undefined) {
+            faceResult.set_code = setCode;
+          }
+          if (collectorNumber !== undefined) {
+            faceResult.collector_number = collectorNumber;
+          }
+          
+          // Add resource URI if we have a file_id
+          if (fileId) {
+            faceResult.resource_uri = `resource://download/card/${fileId}`;
+          }
+          
+          faces.push(faceResult);
+        } catch (faceError) {
+          logger.error(`Error processing face ${file.face_index}:`, faceError);
+          hasError = true;
+          faces.push({
+            status: 'error',
+            message: `Failed to process face ${file.face_index} (${file.face_name})`,
+            face_index: file.face_index,
+            face_name: file.face_name
+          });
+        }
+      }
+      
+      // Return main result with faces array
+      const result: DownloadResult = {
+        status: hasError ? 'error' : 'success',
+        message: hasError 
+          ? `Transform card '${trimmedCardName}' partially downloaded (some faces failed)`
+          : `Transform card '${trimmedCardName}' downloaded successfully (${faces.length} faces)`,
+        card_name: trimmedCardName,
+        total_faces: downloadedFiles[0]?.total_faces,
+        is_transform_card: true,
+        faces: faces
+      };
+      
+      // Add optional fields
+      if (setCode !== undefined) {
+        result.set_code = setCode;
+      }
+      if (collectorNumber !== undefined) {
+        result.collector_number = collectorNumber;
+      }
+      
+      logger.info(`[API] Transform card download completed: ${trimmedCardName} -> ${faces.length} faces`);
+      return result;
+    } else {
+      // Handle single-faced card (backward compatibility)
+      const file = downloadedFiles[0];
+      const filePath = file!.filePath;
+
+      // The download manager registered the file and returns its file_id
+      const fileId = file!.fileId;
+
+      // Build result matching Python implementation structure
+      const result: DownloadResult = {
+        status: 'success',
+        message: `Card '${trimmedCardName}' downloaded successfully`,
+        filepath: filePath,
+        card_name: trimmedCardName
+      };
+      
+      // Add optional fields only if defined (matching Python conditional assignment)
+      if (setCode !== undefined) {
+        result.set_code = setCode;
+      }
+      if (collectorNumber !== undefined) {
+        result.collector_number = collectorNumber;
+      }
+
+      // Add resource URI if we have a file_id (matching Python resource_uri format)
+      if (fileId) {
+        result.resource_uri = `resource://download/card/${fileId}`;
+      }
+
+      logger.info(`[API] Card download successful: ${trimmedCardName} -> ${fileId || 'no file_id'}`);
+      return result;
+    }
+  } else {
+    return {
+      status: 'error',
+      message: `Failed to download card '${trimmedCardName}' - no files were downloaded`
+    };
+  }
+}
+
 /**
  * Download a high-resolution image of a specific Magic: The Gathering card.
  * Returns response structure matching Python implementation.
@@ -62,142 +190,7 @@ export async function mcpDownloadCard(
       baseDir
     );
 
-    if (downloadedFiles.length > 0) {
-      const isTransformCard = downloadedFiles.length > 1;
-      const db = await createCardDatabase();
-      
-      try {
-        if (isTransformCard) {
-          // Handle transform card with multiple faces
-          const faces: DownloadResult[] = [];
-          let hasError = false;
-          
-          for (const file of downloadedFiles) {
-            try {
-              // Generate face-specific card version ID
-              let faceCardVersionId: string;
-              if (setCode && collectorNumber) {
-                faceCardVersionId = `${trimmedCardName}_${setCode.toLowerCase()}_${collectorNumber}_face${file.face_index}`;
-              } else {
-                faceCardVersionId = `${trimmedCardName}_face${file.face_index}`;
-              }
-              
-              const cardInfo = db.getCardInfo(faceCardVersionId);
-              const fileId = cardInfo?.file_id;
-              
-              const faceResult: DownloadResult = {
-                status: 'success',
-                message: `Face ${file.face_index} (${file.face_name}) downloaded successfully`,
-                filepath: file.filePath,
-                card_name: file.cardName,
-                face_index: file.face_index,
-                face_name: file.face_name,
-                total_faces: file.total_faces,
-                is_transform_card: file.is_transform_card
-              };
-              
-              // Add optional fields
-              if (setCode !== undefined) {
-                faceResult.set_code = setCode;
-              }
-              if (collectorNumber !== undefined) {
-                faceResult.collector_number = collectorNumber;
-              }
-              
-              // Add resource URI if we have a file_id
-              if (fileId) {
-                faceResult.resource_uri = `resource://download/card/${fileId}`;
-              }
-              
-              faces.push(faceResult);
-            } catch (faceError) {
-              logger.error(`Error processing face ${file.face_index}:`, faceError);
-              hasError = true;
-              faces.push({
-                status: 'error',
-                message: `Failed to process face ${file.face_index} (${file.face_name})`,
-                face_index: file.face_index,
-                face_name: file.face_name
-              });
-            }
-          }
-          
-          // Return main result with faces array
-          const result: DownloadResult = {
-            status: hasError ? 'error' : 'success',
-            message: hasError 
-              ? `Transform card '${trimmedCardName}' partially downloaded (some faces failed)`
-              : `Transform card '${trimmedCardName}' downloaded successfully (${faces.length} faces)`,
-            card_name: trimmedCardName,
-            total_faces: downloadedFiles[0]?.total_faces,
-            is_transform_card: true,
-            faces: faces
-          };
-          
-          // Add optional fields
-          if (setCode !== undefined) {
-            result.set_code = setCode;
-          }
-          if (collectorNumber !== undefined) {
-            result.collector_number = collectorNumber;
-          }
-          
-          logger.info(`[API] Transform card download completed: ${trimmedCardName} -> ${faces.length} faces`);
-          return result;
-        } else {
-          // Handle single-faced card (backward compatibility)
-          const file = downloadedFiles[0];
-          const filePath = file!.filePath;
-
-          // Generate card version ID matching Python behavior
-          let cardVersionId = trimmedCardName;
-          if (setCode && collectorNumber) {
-            cardVersionId = `${trimmedCardName}_${setCode.toLowerCase()}_${collectorNumber}`;
-          }
-
-          const cardInfo = db.getCardInfo(cardVersionId);
-          let fileId = cardInfo?.file_id;
-
-          // If no existing record found, register the file and get the file_id
-          if (!fileId) {
-            // File should already be registered by the download manager, but let's verify
-            const newCardInfo = db.getCardInfo(cardVersionId);
-            fileId = newCardInfo?.file_id;
-          }
-
-          // Build result matching Python implementation structure
-          const result: DownloadResult = {
-            status: 'success',
-            message: `Card '${trimmedCardName}' downloaded successfully`,
-            filepath: filePath,
-            card_name: trimmedCardName
-          };
-          
-          // Add optional fields only if defined (matching Python conditional assignment)
-          if (setCode !== undefined) {
-            result.set_code = setCode;
-          }
-          if (collectorNumber !== undefined) {
-            result.collector_number = collectorNumber;
-          }
-
-          // Add resource URI if we have a file_id (matching Python resource_uri format)
-          if (fileId) {
-            result.resource_uri = `resource://download/card/${fileId}`;
-          }
-
-          logger.info(`[API] Card download successful: ${trimmedCardName} -> ${fileId || 'no file_id'}`);
-          return result;
-        }
-      } finally {
-        db.close();
-      }
-    } else {
-      return {
-        status: 'error',
-        message: `Failed to download card '${trimmedCardName}' - no files were downloaded`
-      };
-    }
+    return buildCardDownloadResult(trimmedCardName, downloadedFiles, setCode, collectorNumber);
   } catch (error: any) {
     logger.error(`[Error] Failed to download card '${cardName}':`, error);
     return { 
@@ -246,144 +239,118 @@ export async function mcpDownloadArtCrop(
       baseDir
     );
 
-    // Create a unique identifier for the card version (matching Python behavior)
-    let cardVersionId = `${trimmedCardName}_art_crop`;
-    if (setCode && collectorNumber) {
-      cardVersionId = `${trimmedCardName}_${setCode.toLowerCase()}_${collectorNumber}_art_crop`;
-    }
-
     if (downloadedFiles.length > 0) {
       const isTransformCard = downloadedFiles.length > 1;
-      const db = await createCardDatabase();
       
-      try {
-        if (isTransformCard) {
-          // Handle transform card with multiple faces
-          const faces: DownloadResult[] = [];
-          let hasError = false;
-          
-          for (const file of downloadedFiles) {
-            try {
-              // Generate face-specific card version ID
-              let faceCardVersionId: string;
-              if (setCode && collectorNumber) {
-                faceCardVersionId = `${trimmedCardName}_${setCode.toLowerCase()}_${collectorNumber}_face${file.face_index}_art_crop`;
-              } else {
-                faceCardVersionId = `${trimmedCardName}_face${file.face_index}_art_crop`;
-              }
-              
-              const cardInfo = db.getCardInfo(faceCardVersionId);
-              const fileId = cardInfo?.file_id;
-              
-              const faceResult: DownloadResult = {
-                status: 'success',
-                message: `Art crop face ${file.face_index} (${file.face_name}) downloaded successfully`,
-                filepath: file.filePath,
-                card_name: file.cardName,
-                face_index: file.face_index,
-                face_name: file.face_name,
-                total_faces: file.total_faces,
-                is_transform_card: file.is_transform_card
-              };
-              
-              // Add optional fields
-              if (setCode !== undefined) {
-                faceResult.set_code = setCode;
-              }
-              if (collectorNumber !== undefined) {
-                faceResult.collector_number = collectorNumber;
-              }
-              
-              // Add resource URIs if we have a file_id
-              if (fileId) {
-                faceResult.resource_uri = `resource://download/art/${fileId}`;
-                // Add metadata_uri if we have JSON metadata
-                if (file.jsonPath) {
-                  faceResult.metadata_uri = `resource://download/metadata/${fileId}`;
-                }
+      if (isTransformCard) {
+        // Handle transform card with multiple faces
+        const faces: DownloadResult[] = [];
+        let hasError = false;
+        
+        for (const file of downloadedFiles) {
+          try {
+            // The download manager returns the file_id it registered for each face
+            const fileId = file.fileId;
+            
+            const faceResult: DownloadResult = {
+              status: 'success',
+              message: `Art crop face ${file.face_index} (${file.face_name}) downloaded successfully`,
+              filepath: file.filePath,
+              card_name: file.cardName,
+              face_index: file.face_index,
+              face_name: file.face_name,
+              total_faces: file.total_faces,
+              is_transform_card: file.is_transform_card
+            };
+            
+            // Add optional fields
+            if (setCode !== undefined) {
+              faceResult.set_code = setCode;
+            }
+            if (collectorNumber !== undefined) {
+              faceResult.collector_number = collectorNumber;
+            }
+            
+            // Add resource URIs if we have a file_id
+            if (fileId) {
+              faceResult.resource_uri = `resource://download/art/${fileId}`;
+              // Add metadata_uri if we have JSON metadata
+              if (file.jsonPath) {
+                faceResult.metadata_uri = `resource://download/metadata/${fileId}`;
               }
-              
-              faces.push(faceResult);
-            } catch (faceError) {
-              logger.error(`Error processing art crop face ${file.face_index}:`, faceError);
-              hasError = true;
-              faces.push({
-                status: 'error',
-                message: `Failed to process art crop face ${file.face_index} (${file.face_name})`,
-                face_index: file.face_index,
-                face_name: file.face_name
-              });
             }
+            
+            faces.push(faceResult);
+          } catch (faceError) {
+            logger.error(`Error processing art crop face ${file.face_index}:`, faceError);
+            hasError = true;
+            faces.push({
+              status: 'error',
+              message: `Failed to process art crop face ${file.face_index} (${file.face_name})`,
+              face_index: file.face_index,
+              face_name: file.face_name
+            });
           }
-          
-          // Return main result with faces array
-          const result: DownloadResult = {
-            status: hasError ? 'error' : 'success',
-            message: hasError 
-              ? `Transform card art crops for '${trimmedCardName}' partially downloaded (some faces failed)`
-              : `Transform card art crops for '${trimmedCardName}' downloaded successfully (${faces.length} faces)`,
-            card_name: trimmedCardName,
-            total_faces: downloadedFiles[0]?.total_faces,
-            is_transform_card: true,
-            faces: faces
-          };
-          
-          // Add optional fields
-          if (setCode !== undefined) {
-            result.set_code = setCode;
-          }
-          if (collectorNumber !== undefined) {
-            result.collector_number = collectorNumber;
-          }
-          
-          logger.info(`[API] Transform card art crop download completed: ${trimmedCardName} -> ${faces.length} faces`);
-          return result;
-        } else {
-          // Handle single-faced card (backward compatibility)
-          const file = downloadedFiles[0];
-          const imagePath = file!.filePath;
-          const jsonPath = file!.jsonPath;
-
-          const cardInfo = db.getCardInfo(cardVersionId);
-          let fileId = cardInfo?.file_id;
-
-          // If no existing record found, register the file and get the file_id
-          if (!fileId) {
-            // File should already be registered by the download manager, but let's verify
-            const newCardInfo = db.getCardInfo(cardVersionId);
-            fileId = newCardInfo?.file_id;
-          }
+        }
+        
+        // Return main result with faces array
+        const result: DownloadResult = {
+          status: hasError ? 'error' : 'success',
+          message: hasError 
+            ? `Transform card art crops for '${trimmedCardName}' partially downloaded (some faces failed)`
+            : `Transform card art crops for '${trimmedCardName}' downloaded successfully (${faces.length} faces)`,
+          card_name: trimmedCardName,
+          total_faces: downloadedFiles[0]?.total_faces,
+          is_transform_card: true,
+          faces: faces
+        };
+        
+        // Add optional fields
+        if (setCode !== undefined) {
+          result.set_code = setCode;
+        }
+        if (collectorNumber !== undefined) {
+          result.collector_number = collectorNumber;
+        }
+        
+        logger.info(`[API] Transform card art crop download completed: ${trimmedCardName} -> ${faces.length} faces`);
+        return result;
+      } else {
+        // Handle single-faced card (backward compatibility)
+        const file = downloadedFiles[0];
+        const imagePath = file!.filePath;
+        const jsonPath = file!.jsonPath;
 
-          // Build result matching Python implementation structure
-          const result: DownloadResult = {
-            status: 'success',
-            message: `Art crop for '${trimmedCardName}' downloaded successfully`,
-            filepath: imagePath,
-            card_name: trimmedCardName
-          };
-          
-          // Add optional fields only if defined (matching Python conditional assignment)
-          if (setCode !== undefined) {
-            result.set_code = setCode;
-          }
-          if (collectorNumber !== undefined) {
-            result.collector_number = collectorNumber;
-          }
+        // The download manager registered the file and returns its file_id
+        const fileId = file!.fileId;
 
-          // Add resource URIs if we have file_id (matching Python resource_uri format)
-          if (fileId) {
-            result.resource_uri = `resource://download/art/${fileId}`;
-            // Add metadata_uri if we have JSON metadata
-            if (jsonPath) {
-              result.metadata_uri = `resource://download/metadata/${fileId}`;
-            }
-          }
+        // Build result matching Python implementation structure
+        const result: DownloadResult = {
+          status: 'success',
+          message: `Art crop for '${trimmedCardName}' downloaded successfully`,
+          filepath: imagePath,
+          card_name: trimmedCardName
+        };
+        
+        // Add optional fields only if defined (matching Python conditional assignment)
+        if (setCode !== undefined) {
+          result.set_code = setCode;
+        }
+        if (collectorNumber !== undefined) {
+          result.collector_number = collectorNumber;
+        }
 
-          logger.info(`[API] Art crop download successful: ${trimmedCardName} -> ${fileId || 'no file_id'}`);
-          return result;
+        // Add resource URIs if we have file_id (matching Python resource_uri format)
+        if (fileId) {
+          result.resource_uri = `resource://download/art/${fileId}`;
+          // Add metadata_uri if we have JSON metadata
+          if (jsonPath) {
+            result.metadata_uri = `resource://download/metadata/${fileId}`;
+          }
         }
-      } finally {
-        db.close();
+
+        logger.info(`[API] Art crop download successful: ${trimmedCardName} -> ${fileId || 'no file_id'}`);
+        return result;
       }
     } else {
       return {
@@ -398,4 +365,97 @@ export async function mcpDownloadArtCrop(
       message: error instanceof Error ? error.message : 'Unknown error occurred during art crop download'
     };
   }
-}
\ No newline at end of file
+}
+
+/**
+ * Read an optional string argument, treating anything else (or an empty string) as absent.
+ */
+function optionalString(value: unknown): string | undefined {
+  return typeof value === 'string' && value.trim().length > 0 ? value.trim() : undefined;
+}
+
+/**
+ * Download high-resolution images of several cards in one call.
+ * set_codes and collector_numbers are matched to card_names by position. Repeated cards are
+ * downloaded once, and the batch goes through one existence check and the shared worker pool.
+ */
+export async function mcpDownloadCards(
+  cardNames: string[],
+  setCodes?: string[],
+  collectorNumbers?: string[],
+  forceDownload: boolean = false
+): Promise<BatchDownloadResult> {
+  logger.info(`[API] Downloading ${Array.isArray(cardNames) ? cardNames.length : 0} cards`);
+
+  if (!Array.isArray(cardNames) || cardNames.length === 0) {
+    return {
+      status: 'error',
+      message: 'At least one card name is required'
+    };
+  }
+
+  const setCodeList: unknown[] = Array.isArray(setCodes) ? setCodes : [];
+  const collectorNumberList: unknown[] = Array.isArray(collectorNumbers) ? collectorNumbers : [];
+
+  // One entry per distinct card version, in first-seen order
+  const entries = new Map<string, { cardName: string; setCode: string | undefined; collectorNumber: string | undefined }>();
+  let emptyNames = 0;
+  cardNames.forEach((rawName, index) => {
+    const cardName = optionalString(rawName);
+    if (!cardName) {
+      emptyNames++;
+      return;
+    }
+    const setCode = optionalString(setCodeList[index]);
+    const collectorNumber = optionalString(collectorNumberList[index]);
+    const key = `${cardName}\u0000${setCode?.toLowerCase() ?? ''}\u0000${collectorNumber ?? ''}`;
+    if (!entries.has(key)) {
+      entries.set(key, { cardName, setCode, collectorNumber });
+    }
+  });
+  const uniqueEntries = Array.from(entries.values());
+
+  const results: DownloadResult[] = [];
+  if (uniqueEntries.length > 0) {
+    try {
+      // Get the appropriate storage directory (always provide a valid path for MCP mode)
+      const baseDir = await getStorageDirectory();
+
+      const filesPerCard = await downloadManager.downloadCardImagesPerCard(
+        uniqueEntries.map(entry => entry.cardName),
+        forceDownload,
+        uniqueEntries.map(entry => entry.setCode?.toLowerCase()),
+        uniqueEntries.map(entry => entry.collectorNumber),
+        baseDir
+      );
+
+      uniqueEntries.forEach((entry, index) => {
+        results.push(buildCardDownloadResult(entry.cardName, filesPerCard[index] ?? [], entry.setCode, entry.collectorNumber));
+      });
+    } catch (error: any) {
+      logger.error('[Error] Failed to download cards:', error);
+      return {
+        status: 'error',
+        message: error instanceof Error ? error.message : 'Unknown error occurred during card download'
+      };
+    }
+  }
+
+  for (let i = 0; i < emptyNames; i++) {
+    results.push({
+      status: 'error',
+      message: 'Card name cannot be empty'
+    });
+  }
+
+  const failed = results.filter(result => result.status === 'error').length;
+
+  return {
+    status: failed === results.length ? 'error' : 'success',
+    message: failed === 0
+      ? `Downloaded ${results.length} cards successfully`
+      : `Downloaded ${results.length - failed} of ${results.length} cards (${failed} failed)`,
+    count: results.length,
+    results
+  };
+}
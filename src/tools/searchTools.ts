@@ -2,7 +2,7 @@
  * Search-related MCP tools for the Scryfall server.
  */
 
-import { scryfallClient } from '../scryfallClient.js';
+import { scryfallClient, Card } from '../scryfallClient.js';
 import { logger } from '../logger.js';
 
 export interface SearchResult {
@@ -30,6 +30,24 @@ export interface ArtworkResult {
   };
 }
 
+/**
+ * Project a card variant onto the fields returned by search (matches Python format).
+ */
+function toSearchCardInfo(card: Card): Record<string, any> {
+  return {
+    name: card.name || 'Unknown',
+    set: card.set || '',
+    set_name: card.set_name || '',
+    collector_number: card.collector_number || '',
+    rarity: card.rarity || '',
+    artist: card.artist || '',
+    display_name: card.display_name || card.name,
+    id: card.id,
+    scryfall_uri: card.scryfall_uri || '',
+    image_uris: card.image_uris || {}
+  };
+}
+
 /**
  * Search for Magic: The Gathering cards using the Scryfall API.
  * Implements the same card grouping logic as the Python version.
@@ -57,51 +75,22 @@ export async function mcpSearchCards(query: string): Promise<SearchResult> {
     // Group cards by name and identify alternate artworks (matches Python group_cards_by_name_and_art)
     const cardGroups = scryfallClient.groupCardsByNameAndArt(cards);
 
-    // Create response structure matching Python implementation format
+    // Create response structure matching Python implementation format; each group is
+    // projected in a single pass with no intermediate arrays or per-variant bookkeeping
+    const resultCards: Record<string, any[]> = {};
+    for (const [name, variants] of Object.entries(cardGroups)) {
+      if (name && variants.length > 0) {
+        resultCards[name] = variants.map(toSearchCardInfo);
+      }
+    }
+
     const result: SearchResult = {
       status: 'success',
       count: cards.length,
-      cards: {}
+      cards: resultCards
     };
 
-    // Process each card group to ensure nested structure matches Python version
-    for (const [name, variants] of Object.entries(cardGroups)) {
-      if (!name || variants.length === 0) {
-        continue; // Skip invalid groups
-      }
-
-      result.cards![name] = [];
-
-      for (const card of variants) {
-        try {
-          // Extract essential information for each card variant (matches Python format)
-          const cardInfo = {
-            name: card.name || 'Unknown',
-            set: card.set || '',
-            set_name: card.set_name || '',
-            collector_number: card.collector_number || '',
-            rarity: card.rarity || '',
-            artist: card.artist || '',
-            display_name: card.display_name || card.name,
-            id: card.id,
-            scryfall_uri: card.scryfall_uri || '',
-            image_uris: card.image_uris || {}
-          };
-
-          result.cards![name].push(cardInfo);
-        } catch (cardError: any) {
-          logger.warn(`Error processing card variant: ${cardError.message}`);
-          continue; // Skip problematic card variants
-        }
-      }
-
-      // Remove empty groups
-      if (result.cards![name].length === 0) {
-        delete result.cards![name];
-      }
-    }
-
-    logger.info(`[API] Found ${cards.length} cards grouped into ${Object.keys(result.cards!).length} unique names for query: ${query}`);
+    logger.info(`[API] Found ${cards.length} cards grouped into ${Object.keys(resultCards).length} unique names for query: ${query}`);
     return result;
     
   } catch (error: any) {
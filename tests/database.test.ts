@@ -6,7 +6,7 @@ import { describe, it, expect, beforeEach, afterEach } from '@jest/globals';
 import { tmpdir } from 'node:os';
 import { join } from 'node:path';
 import { rm } from 'node:fs/promises';
-import { CardDatabase } from '../src/database.js';
+import { CardDatabase, getSharedCardDatabase, closeSharedCardDatabase } from '../src/database.js';
 
 describe('CardDatabase', () => {
   let db: CardDatabase;
@@ -42,6 +42,38 @@ describe('CardDatabase', () => {
       
       expect(tables.some(t => t.name === 'downloaded_cards')).toBe(true);
     });
+
+    it('should open the database in WAL mode and record the schema version', () => {
+      const sqlite = db.getDatabase();
+      expect(sqlite.pragma('journal_mode', { simple: true })).toBe('wal');
+      expect(sqlite.pragma('user_version', { simple: true })).toBeGreaterThan(0);
+      expect(sqlite.pragma('cache_size', { simple: true })).toBe(-65536);
+    });
+
+    it('should index card names', () => {
+      const indexes = db.getDatabase()
+        .prepare("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='downloaded_cards'")
+        .all() as { name: string }[];
+
+      expect(indexes.some(i => i.name === 'idx_card_name')).toBe(true);
+    });
+
+    it('should serve face prefix lookups from the NOCASE index', () => {
+      const plan = db.getDatabase()
+        .prepare("EXPLAIN QUERY PLAN SELECT * FROM downloaded_cards WHERE card_name LIKE 'Delver of Secrets (Face %'")
+        .all() as { detail: string }[];
+
+      expect(plan.some(row => row.detail.includes('idx_card_name_nocase'))).toBe(true);
+    });
+
+    it('should reopen an existing database without repeating migrations', async () => {
+      db.addCard('Lightning Bolt', '/test/path/lightning_bolt.jpg');
+      db.close();
+
+      db = new CardDatabase();
+      await db.init(testDbPath);
+      expect(db.cardExists('Lightning Bolt')).toBe(true);
+    });
   });
 
   describe('Card operations', () => {
@@ -83,6 +115,16 @@ describe('CardDatabase', () => {
       expect(db.cardExists('Lightning Bolt')).toBe(false);
     });
 
+    it('should remove cards in bulk', () => {
+      db.addCard('Lightning Bolt', '/test/path/lightning_bolt.jpg');
+      db.addCard('Counterspell', '/test/path/counterspell.jpg');
+      db.addCard('Dark Ritual', '/test/path/dark_ritual.jpg');
+
+      const removed = db.removeCardsBulk(['Lightning Bolt', 'Counterspell', 'Giant Growth']);
+      expect(removed).toBe(2);
+      expect(db.getAllCards().map(c => c.card_name)).toEqual(['Dark Ritual']);
+    });
+
     it('should get card by file ID', () => {
       const fileId = db.addCard('Lightning Bolt', '/test/path/lightning_bolt.jpg');
       
@@ -108,6 +150,46 @@ describe('CardDatabase', () => {
       expect(allCards.some(c => c.card_name === 'Lightning Bolt')).toBe(true);
       expect(allCards.some(c => c.card_name === 'Counterspell')).toBe(true);
     });
+
+    it('should count and iterate over all cards', () => {
+      db.addCard('Lightning Bolt', '/test/path/lightning_bolt.jpg');
+      db.addCard('Counterspell', '/test/path/counterspell.jpg');
+
+      expect(db.getCardCount()).toBe(2);
+      const names = Array.from(db.iterateCards(), card => card.card_name);
+      expect(names.sort()).toEqual(['Counterspell', 'Lightning Bolt']);
+    });
+
+    it('should summarize cards by set and recency in SQL', () => {
+      db.addCard('Lightning Bolt', '/test/path/lightning_bolt.jpg', undefined, 'lea');
+      db.addCard('Counterspell', '/test/path/counterspell.jpg', undefined, 'lea');
+      db.addCard('Dark Ritual', '/test/path/dark_ritual.jpg');
+
+      expect(db.getSetCounts()).toEqual({ lea: 2, Unknown: 1 });
+      expect(db.getRecentCards(2)).toHaveLength(2);
+      expect(db.getRecentCards(5)[0]).toHaveProperty('download_date');
+    });
+
+    it('should add cards in bulk', () => {
+      const fileIds = db.addCardsBulk([
+        { cardName: 'Lightning Bolt', filename: '/test/path/lightning_bolt.jpg', setCode: 'lea' },
+        { cardName: 'Counterspell', filename: '/test/path/counterspell.jpg' }
+      ]);
+
+      expect(fileIds).toHaveLength(2);
+      expect(db.getCardByFileId(fileIds[0]!)!.card_name).toBe('Lightning Bolt');
+      expect(db.getCardByFileId(fileIds[1]!)!.card_name).toBe('Counterspell');
+      expect(db.getAllCards()).toHaveLength(2);
+    });
+
+    it('should report which cards exist in bulk', () => {
+      db.addCard('Lightning Bolt', '/test/path/lightning_bolt.jpg');
+      db.addCard('Counterspell', '/test/path/counterspell.jpg');
+
+      const existing = db.cardsExistBulk(['Lightning Bolt', 'Dark Ritual', 'Counterspell']);
+      expect(existing).toEqual(new Set(['Lightning Bolt', 'Counterspell']));
+      expect(db.cardsExistBulk([]).size).toBe(0);
+    });
   });
 
   describe('File ID handling', () => {
@@ -137,5 +219,53 @@ describe('CardDatabase', () => {
       expect(cardInfo).toBeDefined();
       expect(cardInfo!.file_id).toBe(customFileId);
     });
+
+    it('should update an existing record in place when re-registering a file ID', () => {
+      const fileId = db.addCard('Lightning Bolt', '/test/path/old.jpg');
+      const before = db.getCardByFileId(fileId)!;
+
+      db.addCard('Lightning Bolt', '/test/path/new.jpg', undefined, 'm10', undefined, fileId);
+
+      const after = db.getCardByFileId(fileId)!;
+      expect(after.id).toBe(before.id);
+      expect(after.filename).toBe('/test/path/new.jpg');
+      expect(after.set_code).toBe('m10');
+      expect(db.getAllCards()).toHaveLength(1);
+    });
+  });
+
+  describe('Shared connection', () => {
+    afterEach(async () => {
+      await closeSharedCardDatabase();
+    });
+
+    it('should reuse one connection across callers', async () => {
+      const first = await getSharedCardDatabase();
+      const second = await getSharedCardDatabase();
+      expect(second).toBe(first);
+
+      await closeSharedCardDatabase();
+      const reopened = await getSharedCardDatabase();
+      expect(reopened).not.toBe(first);
+    });
+
+    it('should close the previous connection when the data directory changes', async () => {
+      const originalDataDir = process.env['SCRYFALL_DATA_DIR'];
+      const otherDataDir = join(tmpdir(), `scryfall-shared-db-test-${Date.now()}`);
+      const first = await getSharedCardDatabase();
+
+      process.env['SCRYFALL_DATA_DIR'] = otherDataDir;
+      try {
+        const second = await getSharedCardDatabase();
+        expect(second).not.toBe(first);
+        await new Promise(resolve => setImmediate(resolve));
+        expect(first.getDatabase().open).toBe(false);
+        expect(second.getDatabase().open).toBe(true);
+      } finally {
+        await closeSharedCardDatabase();
+        process.env['SCRYFALL_DATA_DIR'] = originalDataDir;
+        await rm(otherDataDir, { recursive: true, force: true });
+      }
+    });
   });
-});
\ No newline at end of file
+});
@@ -11,7 +11,9 @@ import {
   getStorageDirectory, 
   getCardImagesDirectory, 
   getArtCropsDirectory,
-  getDatabasePath 
+  getDatabasePath,
+  ensureDirectory,
+  directoryExists
 } from '../src/config.js';
 
 // Rate limiting for API calls
@@ -51,6 +53,30 @@ describe('Integration Tests', () => {
       expect(artCropsDir).toBe(join(testDataDir, 'scryfall_images'));
       expect(dbPath).toBe(join(testDataDir, 'scryfall_database.db'));
     });
+
+    it('should re-resolve cached directories when SCRYFALL_DATA_DIR changes', async () => {
+      expect(await getStorageDirectory()).toBe(testDataDir);
+
+      const otherDataDir = `${testDataDir}-other`;
+      process.env['SCRYFALL_DATA_DIR'] = otherDataDir;
+      try {
+        expect(await getStorageDirectory()).toBe(otherDataDir);
+      } finally {
+        process.env['SCRYFALL_DATA_DIR'] = testDataDir;
+        await rm(otherDataDir, { recursive: true, force: true });
+      }
+
+      expect(await getStorageDirectory()).toBe(testDataDir);
+    });
+
+    it('should create nested directories once with ensureDirectory', async () => {
+      const nestedDir = join(testDataDir, 'ensure', 'nested');
+      await ensureDirectory(nestedDir);
+      await ensureDirectory(nestedDir);
+      await ensureDirectory(join(testDataDir, 'ensure'));
+
+      expect(directoryExists(nestedDir)).toBe(true);
+    });
   });
 
   describe('MCP Server', () => {
@@ -73,6 +99,7 @@ describe('Integration Tests', () => {
       const toolNames = response.tools.map((tool: any) => tool.name);
       expect(toolNames).toContain('mcp_search_cards');
       expect(toolNames).toContain('mcp_download_card');
+      expect(toolNames).toContain('mcp_download_cards');
       expect(toolNames).toContain('mcp_download_art_crop');
       expect(toolNames).toContain('mcp_verify_database');
     });
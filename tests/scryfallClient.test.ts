@@ -0,0 +1,263 @@
+/**
+ * ScryfallClient tests against canned responses, without network access.
+ */
+
+import { describe, it, expect, beforeAll } from '@jest/globals';
+import { Response, FetchError } from 'node-fetch';
+import { ScryfallClient, FetchFunction, Card, SearchResponse } from '../src/scryfallClient.js';
+
+const SEARCH_URL = 'https://api.scryfall.com/cards/search';
+const SECOND_PAGE_URL = `${SEARCH_URL}?q=set%3Alea&page=2`;
+
+/**
+ * Freeze a fixture and everything nested in it, so a stray write throws instead of leaking into later tests.
+ */
+function deepFreeze<T>(value: T): Readonly<T> {
+  for (const nested of Object.values(value as object)) {
+    if (nested && typeof nested === 'object' && !Object.isFrozen(nested)) {
+      deepFreeze(nested);
+    }
+  }
+  return Object.freeze(value);
+}
+
+// Fixtures are built once for the whole file and deep-frozen so no test can change them for another
+const lightningBolt: Readonly<Card> = deepFreeze({
+  id: 'card-1',
+  name: 'Lightning Bolt',
+  set: 'lea',
+  set_name: 'Limited Edition Alpha',
+  collector_number: '161',
+  rarity: 'common',
+  artist: 'Christopher Rush',
+  scryfall_uri: 'https://scryfall.com/card/lea/161'
+});
+
+const counterspell: Readonly<Card> = deepFreeze({
+  ...lightningBolt,
+  id: 'card-2',
+  name: 'Counterspell',
+  collector_number: '54',
+  artist: 'Mark Poole',
+  scryfall_uri: 'https://scryfall.com/card/lea/54'
+});
+
+const singlePage: Readonly<SearchResponse> = deepFreeze({
+  object: 'list',
+  total_cards: 1,
+  has_more: false,
+  data: [lightningBolt]
+});
+
+const firstPage: Readonly<SearchResponse> = deepFreeze({
+  object: 'list',
+  total_cards: 2,
+  has_more: true,
+  next_page: SECOND_PAGE_URL,
+  data: [lightningBolt]
+});
+
+const secondPage: Readonly<SearchResponse> = deepFreeze({
+  object: 'list',
+  total_cards: 2,
+  has_more: false,
+  data: [counterspell]
+});
+
+// Response bodies are one-shot streams, so each test gets a new Response around pre-serialized text
+const singlePageBody = JSON.stringify(singlePage);
+const firstPageBody = JSON.stringify(firstPage);
+const secondPageBody = JSON.stringify(secondPage);
+const notFoundBody = JSON.stringify({ object: 'error', details: 'No cards found' });
+
+/**
+ * Build a fetch that answers each request from handler and records the requested URLs.
+ */
+function fakeFetch(handler: (url: string) => Response): { fetch: FetchFunction; urls: string[] } {
+  const urls: string[] = [];
+  const fetch = (async (url: Parameters<FetchFunction>[0]) => {
+    urls.push(String(url));
+    return handler(String(url));
+  }) as FetchFunction;
+  return { fetch, urls };
+}
+
+// Clients that should never reach the network get this fetch, so a stray request fails loudly
+const noNetwork = (async (url: Parameters<FetchFunction>[0]) => {
+  throw new Error(`Unexpected network request: ${String(url)}`);
+}) as FetchFunction;
+
+function jsonResponse(body: string, status = 200): Response {
+  return new Response(body, {
+    status,
+    headers: { 'Content-Type': 'application/json' }
+  });
+}
+
+describe('ScryfallClient (offline)', () => {
+  describe('searchCards', () => {
+    interface SearchCase {
+      description: string;
+      query: string;
+      handler: (url: string) => Response;
+      expectedNames: string[];
+      expectedUrls: string[];
+    }
+
+    it.each<SearchCase>([
+      {
+        description: 'return the cards from a single page',
+        query: 'name:"Lightning Bolt"',
+        handler: () => jsonResponse(singlePageBody),
+        expectedNames: ['Lightning Bolt'],
+        expectedUrls: [`${SEARCH_URL}?q=${encodeURIComponent('name:"Lightning Bolt"')}`]
+      },
+      {
+        description: 'follow next_page until has_more is false',
+        query: 'set:lea',
+        handler: url => jsonResponse(url === SECOND_PAGE_URL ? secondPageBody : firstPageBody),
+        expectedNames: ['Lightning Bolt', 'Counterspell'],
+        expectedUrls: [`${SEARCH_URL}?q=set%3Alea`, SECOND_PAGE_URL]
+      },
+      {
+        description: 'return no cards when the search finds nothing',
+        query: 'name:"Nonexistent Card"',
+        handler: () => jsonResponse(notFoundBody, 404),
+        expectedNames: [],
+        expectedUrls: [`${SEARCH_URL}?q=${encodeURIComponent('name:"Nonexistent Card"')}`]
+      }
+    ])('should $description', async ({ query, handler, expectedNames, expectedUrls }) => {
+      const { fetch, urls } = fakeFetch(handler);
+      const client = new ScryfallClient(fetch);
+
+      const cards = await client.searchCards(query);
+
+      expect(cards.map(card => card.name)).toEqual(expectedNames);
+      expect(urls).toEqual(expectedUrls);
+    });
+
+    it('should answer a repeated query from the cache without another request', async () => {
+      const { fetch, urls } = fakeFetch(() => jsonResponse(singlePageBody));
+      const client = new ScryfallClient(fetch);
+
+      const first = await client.searchCards('name:"Lightning Bolt"');
+      first[0]!.display_name = 'changed by the caller';
+      const second = await client.searchCards('name:"Lightning Bolt"');
+
+      expect(urls).toHaveLength(1);
+      expect(second.map(card => card.name)).toEqual(['Lightning Bolt']);
+      expect(second[0]!.display_name).toBeUndefined();
+    });
+
+    it('should not cache result sets above the size limit', async () => {
+      const largePageBody = JSON.stringify({
+        ...singlePage,
+        total_cards: 501,
+        data: Array.from({ length: 501 }, (_, i) => ({ ...lightningBolt, id: `card-${i}` }))
+      });
+      const { fetch, urls } = fakeFetch(() => jsonResponse(largePageBody));
+      const client = new ScryfallClient(fetch);
+
+      await client.searchCards('t:instant');
+      const second = await client.searchCards('t:instant');
+
+      expect(urls).toHaveLength(2);
+      expect(second).toHaveLength(501);
+    });
+
+    it('should raise after retrying failed requests', async () => {
+      const { fetch, urls } = fakeFetch(() => {
+        throw new FetchError('API Error', 'system');
+      });
+      const client = new ScryfallClient(fetch);
+
+      await expect(client.searchCards('name:"Lightning Bolt"')).rejects.toThrow(FetchError);
+      expect(urls).toHaveLength(3);
+    });
+  });
+
+  describe('groupCardsByNameAndArt', () => {
+    let grouped: Record<string, Card[]>;
+
+    /**
+     * Build cards whose property reads are counted, so grouping cost is measured without timing.
+     */
+    function countedCards(count: number, distinctNames: number): { cards: Card[]; reads: () => number } {
+      let reads = 0;
+      const handler: ProxyHandler<Card> = {
+        get(target, property, receiver) {
+          reads++;
+          return Reflect.get(target, property, receiver);
+        }
+      };
+      const cards = Array.from({ length: count }, (_, i) =>
+        new Proxy<Card>({ ...lightningBolt, id: `card-${i}`, name: `Card ${i % distinctNames}` }, handler)
+      );
+      return { cards, reads: () => reads };
+    }
+
+    beforeAll(() => {
+      // Grouping labels the cards it is given, so group copies of the frozen fixtures once
+      const reprint = { ...lightningBolt, id: 'card-3', set: 'm10', set_name: 'Magic 2010', collector_number: '146' };
+      grouped = new ScryfallClient(noNetwork).groupCardsByNameAndArt([{ ...lightningBolt }, { ...counterspell }, reprint]);
+    });
+
+    it('should group printings by card name', () => {
+      expect(Object.keys(grouped)).toEqual(['Lightning Bolt', 'Counterspell']);
+      expect(grouped['Lightning Bolt']!.map(card => card.id)).toEqual(['card-1', 'card-3']);
+      expect(grouped['Counterspell']).toHaveLength(1);
+    });
+
+    it('should label each printing with its set, number and artist', () => {
+      expect(grouped['Lightning Bolt']!.map(card => card.display_name)).toEqual([
+        'Lightning Bolt [LEA - Limited Edition Alpha, #161, Art: Christopher Rush]',
+        'Lightning Bolt [M10 - Magic 2010, #146, Art: Christopher Rush]'
+      ]);
+      expect(lightningBolt.display_name).toBeUndefined();
+    });
+
+    it('should place every card of a large result set in exactly one group', () => {
+      const cards = Array.from({ length: 20000 }, (_, i) => ({
+        ...lightningBolt,
+        id: `card-${i}`,
+        name: `Card ${i % 1000}`,
+        set: `s${i % 50}`,
+        artist: `Artist ${i % 7}`
+      }));
+
+      const largeGroups = new ScryfallClient(noNetwork).groupCardsByNameAndArt(cards);
+      const groupedCards = Object.values(largeGroups).flat();
+
+      expect(Object.keys(largeGroups)).toHaveLength(1000);
+      expect(Object.values(largeGroups).every(group => group.length === 20)).toBe(true);
+      expect(groupedCards).toHaveLength(20000);
+      expect(new Set(groupedCards.map(card => card.id)).size).toBe(20000);
+      expect(groupedCards.every(card => card.display_name?.startsWith(`${card.name} [${card.set.toUpperCase()} - `))).toBe(true);
+    });
+
+    it('should read each card a constant number of times as the input grows', () => {
+      const client = new ScryfallClient(noNetwork);
+      const small = countedCards(5000, 500);
+      const large = countedCards(20000, 2000);
+
+      client.groupCardsByNameAndArt(small.cards);
+      client.groupCardsByNameAndArt(large.cards);
+
+      // Linear grouping does 4x the reads for 4x the cards; rescanning earlier cards would be ~16x
+      expect(large.reads() / small.reads()).toBeLessThan(8);
+    });
+
+    it('should cost the same per card however many distinct names there are', () => {
+      const client = new ScryfallClient(noNetwork);
+      const fewNames = countedCards(2000, 10);
+      const manyNames = countedCards(2000, 2000);
+
+      const fewGroups = client.groupCardsByNameAndArt(fewNames.cards);
+      client.groupCardsByNameAndArt(manyNames.cards);
+
+      // Keyed lookup reads each card the same way; a linear scan over groups grows with the name count
+      expect(Object.keys(fewGroups)).toHaveLength(10);
+      expect(manyNames.reads()).toBeLessThan(fewNames.reads() * 2);
+    });
+  });
+});